@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     judge0_url: str = "http://judgezero-server:2358"
     judge0_auth_token: Optional[str] = None
     
+    # Polling
+    poll_interval: float = 0.5  # seconds between Judge0 result polls
+
     # Execution Limits
     default_time_limit: float = 5.0  # seconds
     default_memory_limit: int = 128000  # KB (128 MB)
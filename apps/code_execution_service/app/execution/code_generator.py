@@ -24,13 +24,16 @@ This eliminates the need for regex parsing and provides a robust, language-agnos
 """
 
 import base64
+import functools
 import io
-import json
 import os
 import zipfile
 from enum import Enum
+from string import Template
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
 
 class LanguageEnum(str, Enum):
     PYTHON = "python"
@@ -91,6 +94,96 @@ TYPE_MAPPINGS = {
     }
 }
 
+# Types that require helper class definitions in generated code
+CUSTOM_TYPES = frozenset({"ListNode", "TreeNode"})
+
+# Compile/run scripts for Judge0 multi-file programs (language_id 89)
+JAVA_COMPILE_SCRIPT = '''#!/bin/bash
+/usr/local/openjdk13/bin/javac -classpath ".:gson-2.11.0.jar" Main.java
+'''
+
+JAVA_RUN_SCRIPT = '''#!/bin/bash
+/usr/local/openjdk13/bin/java -classpath ".:gson-2.11.0.jar" Main
+'''
+
+CPP_COMPILE_SCRIPT = '''#!/bin/bash
+/usr/local/gcc-9.2.0/bin/g++ -std=c++14 -I. main.cpp -o main
+'''
+
+CPP_RUN_SCRIPT = '''#!/bin/bash
+./main
+'''
+
+# Wrapper templates for interpreted languages, parsed once at import.
+# Substitution values (including user code) are inserted verbatim and never
+# re-scanned for placeholders.
+PYTHON_WRAPPER_TEMPLATE = Template('''from typing import List, Optional, Dict, Tuple, Set, Union
+from collections import defaultdict, deque, Counter, OrderedDict
+from heapq import heappush, heappop, heapify, heappushpop, heapreplace, nlargest, nsmallest
+import bisect
+import math
+import itertools
+import functools
+${helper_code}${conversion_functions}${user_code}
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    input_data = json.loads(sys.stdin.read())
+${conversion_code}
+    solution = Solution()
+    result = solution.${function_name}(${args_str})
+    ${result_conversion}
+    print(json.dumps(result))
+''')
+
+JAVASCRIPT_WRAPPER_TEMPLATE = Template('''${helper_code}${conversion_functions}${user_code}
+
+// Read all stdin synchronously
+const input = require('fs').readFileSync('/dev/stdin', 'utf-8');
+const inputData = JSON.parse(input);
+${conversion_code}
+${result_line}
+console.log(JSON.stringify(result));
+''')
+
+
+def _custom_types_needed(arguments, return_type) -> frozenset:
+    """Return the custom types (ListNode/TreeNode) used by a signature"""
+    types = {arg["type"] for arg in arguments}
+    types.add(return_type)
+    return types & CUSTOM_TYPES
+
+
+@functools.lru_cache(maxsize=None)
+def _load_library(filename: str) -> bytes:
+    """Read a bundled library (gson jar / json.hpp) from disk once and reuse it"""
+    lib_path = os.path.join(os.path.dirname(__file__), "libraries", filename)
+    with open(lib_path, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _bundle_template(language: LanguageEnum) -> bytes:
+    """
+    Zip holding the static bundle members (compile/run scripts + library),
+    compressed once. Per-request bundles copy these bytes and append the
+    generated source in append mode, so the large library is never
+    re-compressed.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        if language == LanguageEnum.JAVA:
+            zip_file.writestr('compile', JAVA_COMPILE_SCRIPT)
+            zip_file.writestr('run', JAVA_RUN_SCRIPT)
+            zip_file.writestr('gson-2.11.0.jar', _load_library("gson-2.11.0.jar"))
+        else:
+            zip_file.writestr('compile', CPP_COMPILE_SCRIPT)
+            zip_file.writestr('run', CPP_RUN_SCRIPT)
+            zip_file.writestr('json.hpp', _load_library("json.hpp"))
+    return buffer.getvalue()
+
 
 class CodeGenerator:
     """Generates executable code with wrappers for Judge0 execution"""
@@ -116,14 +209,22 @@ class CodeGenerator:
             - For Python/JS: (wrapped_code, stdin, None)
             - For Java/C++: ("", stdin, base64_zip_with_libraries)
         """
+        # Serialize stdin once for all languages; orjson emits bytes, so only
+        # a single decode to str happens per request.
+        stdin_data = orjson.dumps(input_data).decode()
+
+        # Empty user_code still gets the full wrapper (and, for compiled
+        # languages, the zip bundle): Judge0 rejects blank source outright,
+        # so short-circuiting here would turn an empty submission into a 500
+        # instead of its deterministic structured failure.
         if language == LanguageEnum.PYTHON:
-            return self._generate_python_wrapper(user_code, function_signature, input_data)
+            return self._generate_python_wrapper(user_code, function_signature, stdin_data)
         elif language == LanguageEnum.JAVASCRIPT:
-            return self._generate_javascript_wrapper(user_code, function_signature, input_data)
+            return self._generate_javascript_wrapper(user_code, function_signature, stdin_data)
         elif language == LanguageEnum.JAVA:
-            return self._generate_java_wrapper(user_code, function_signature, input_data)
+            return self._generate_java_wrapper(user_code, function_signature, stdin_data)
         elif language == LanguageEnum.CPP:
-            return self._generate_cpp_wrapper(user_code, function_signature, input_data)
+            return self._generate_cpp_wrapper(user_code, function_signature, stdin_data)
         else:
             raise ValueError(f"Unsupported language: {language}")
     
@@ -131,7 +232,7 @@ class CodeGenerator:
         self,
         user_code: str,
         function_signature: Dict[str, Any],
-        input_data: Dict[str, Any]
+        stdin_data: str
     ) -> Tuple[str, str, None]:
         """Generate Python wrapper with stdin/stdout"""
         function_name = function_signature["function_name"]
@@ -139,10 +240,9 @@ class CodeGenerator:
         return_type = function_signature["return_type"]
         
         # Check if we need ListNode or TreeNode classes
-        needs_listnode = (any(arg["type"] == "ListNode" for arg in arguments) 
-                          or return_type == "ListNode")
-        needs_treenode = (any(arg["type"] == "TreeNode" for arg in arguments) 
-                          or return_type == "TreeNode")
+        custom_types = _custom_types_needed(arguments, return_type)
+        needs_listnode = "ListNode" in custom_types
+        needs_treenode = "TreeNode" in custom_types
         
         # Generate helper classes and functions
         helper_code = ""
@@ -255,35 +355,23 @@ def treenode_to_array(root):
         else:
             result_conversion = ""
         
-        wrapper_code = f'''from typing import List, Optional, Dict, Tuple, Set, Union
-from collections import defaultdict, deque, Counter, OrderedDict
-from heapq import heappush, heappop, heapify, heappushpop, heapreplace, nlargest, nsmallest
-import bisect
-import math
-import itertools
-import functools
-{helper_code}{conversion_functions}{user_code}
-
-if __name__ == "__main__":
-    import json
-    import sys
-    
-    input_data = json.loads(sys.stdin.read())
-{conversion_code}
-    solution = Solution()
-    result = solution.{function_name}({args_str})
-    {result_conversion}
-    print(json.dumps(result))
-'''
+        wrapper_code = PYTHON_WRAPPER_TEMPLATE.substitute(
+            helper_code=helper_code,
+            conversion_functions=conversion_functions,
+            user_code=user_code,
+            conversion_code=conversion_code,
+            function_name=function_name,
+            args_str=args_str,
+            result_conversion=result_conversion,
+        )
         
-        stdin_data = json.dumps(input_data)
         return wrapper_code, stdin_data, None
     
     def _generate_javascript_wrapper(
         self,
         user_code: str,
         function_signature: Dict[str, Any],
-        input_data: Dict[str, Any]
+        stdin_data: str
     ) -> Tuple[str, str, None]:
         """Generate JavaScript wrapper with stdin/stdout"""
         function_name = function_signature["function_name"]
@@ -291,14 +379,9 @@ if __name__ == "__main__":
         return_type = function_signature["return_type"]
         
         # Check if we need ListNode or TreeNode classes
-        needs_listnode = (
-            any(arg["type"] == "ListNode" for arg in arguments) or
-            return_type == "ListNode"
-        )
-        needs_treenode = (
-            any(arg["type"] == "TreeNode" for arg in arguments) or
-            return_type == "TreeNode"
-        )
+        custom_types = _custom_types_needed(arguments, return_type)
+        needs_listnode = "ListNode" in custom_types
+        needs_treenode = "TreeNode" in custom_types
         
         # Generate helper classes and functions
         helper_code = ""
@@ -436,24 +519,21 @@ function treeNodeToArray(root) {
         else:
             result_line = f'const result = {function_name}({args_str});'
         
-        wrapper_code = f'''{helper_code}{conversion_functions}{user_code}
-
-// Read all stdin synchronously
-const input = require('fs').readFileSync('/dev/stdin', 'utf-8');
-const inputData = JSON.parse(input);
-{conversion_code}
-{result_line}
-console.log(JSON.stringify(result));
-'''
+        wrapper_code = JAVASCRIPT_WRAPPER_TEMPLATE.substitute(
+            helper_code=helper_code,
+            conversion_functions=conversion_functions,
+            user_code=user_code,
+            conversion_code=conversion_code,
+            result_line=result_line,
+        )
         
-        stdin_data = json.dumps(input_data)
         return wrapper_code, stdin_data, None
     
     def _generate_java_wrapper(
         self,
         user_code: str,
         function_signature: Dict[str, Any],
-        input_data: Dict[str, Any]
+        stdin_data: str
     ) -> Tuple[str, str, Optional[str]]:
         """
         Generate Java wrapper with GSON library bundled as additional_files.
@@ -464,14 +544,9 @@ console.log(JSON.stringify(result));
         return_type = function_signature["return_type"]
         
         # Check if we need ListNode or TreeNode classes
-        needs_listnode = (
-            any(arg["type"] == "ListNode" for arg in arguments) or
-            return_type == "ListNode"
-        )
-        needs_treenode = (
-            any(arg["type"] == "TreeNode" for arg in arguments) or
-            return_type == "TreeNode"
-        )
+        custom_types = _custom_types_needed(arguments, return_type)
+        needs_listnode = "ListNode" in custom_types
+        needs_treenode = "TreeNode" in custom_types
         
         # Generate helper classes
         helper_classes = ""
@@ -687,37 +762,14 @@ public class Main {{
 }}
 '''
         
-        # Create compile script
-        compile_script = '''#!/bin/bash
-/usr/local/openjdk13/bin/javac -classpath ".:gson-2.11.0.jar" Main.java
-'''
-        
-        # Create run script
-        run_script = '''#!/bin/bash
-/usr/local/openjdk13/bin/java -classpath ".:gson-2.11.0.jar" Main
-'''
-        
-        # Load GSON library
-        lib_path = os.path.join(
-            os.path.dirname(__file__), 
-            "libraries", 
-            "gson-2.11.0.jar"
-        )
-        with open(lib_path, 'rb') as f:
-            gson_jar = f.read()
-        
-        # Create zip file with all necessary files
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Append the generated source to a copy of the pre-built bundle
+        zip_buffer = io.BytesIO(_bundle_template(LanguageEnum.JAVA))
+        with zipfile.ZipFile(zip_buffer, 'a', zipfile.ZIP_DEFLATED) as zip_file:
             zip_file.writestr('Main.java', main_java)
-            zip_file.writestr('compile', compile_script)
-            zip_file.writestr('run', run_script)
-            zip_file.writestr('gson-2.11.0.jar', gson_jar)
         
         # Encode as base64
         additional_files_b64 = base64.b64encode(zip_buffer.getvalue()).decode('utf-8')
         
-        stdin_data = json.dumps(input_data)
         # Return empty source_code since code is in additional_files
         return "", stdin_data, additional_files_b64
     
@@ -725,7 +777,7 @@ public class Main {{
         self,
         user_code: str,
         function_signature: Dict[str, Any],
-        input_data: Dict[str, Any]
+        stdin_data: str
     ) -> Tuple[str, str, Optional[str]]:
         """
         Generate C++ wrapper with nlohmann/json library bundled as additional_files.
@@ -736,14 +788,9 @@ public class Main {{
         return_type = function_signature["return_type"]
         
         # Check if we need ListNode or TreeNode classes
-        needs_listnode = (
-            any(arg["type"] == "ListNode" for arg in arguments) or
-            return_type == "ListNode"
-        )
-        needs_treenode = (
-            any(arg["type"] == "TreeNode" for arg in arguments) or
-            return_type == "TreeNode"
-        )
+        custom_types = _custom_types_needed(arguments, return_type)
+        needs_listnode = "ListNode" in custom_types
+        needs_treenode = "TreeNode" in custom_types
         
         # Generate helper classes and functions
         helper_code = ""
@@ -941,37 +988,14 @@ int main() {{
 }}
 '''
         
-        # Create compile script
-        compile_script = '''#!/bin/bash
-/usr/local/gcc-9.2.0/bin/g++ -std=c++14 -I. main.cpp -o main
-'''
-        
-        # Create run script
-        run_script = '''#!/bin/bash
-./main
-'''
-        
-        # Load nlohmann/json library
-        lib_path = os.path.join(
-            os.path.dirname(__file__), 
-            "libraries", 
-            "json.hpp"
-        )
-        with open(lib_path, 'rb') as f:
-            json_hpp = f.read()
-        
-        # Create zip file with all necessary files
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Append the generated source to a copy of the pre-built bundle
+        zip_buffer = io.BytesIO(_bundle_template(LanguageEnum.CPP))
+        with zipfile.ZipFile(zip_buffer, 'a', zipfile.ZIP_DEFLATED) as zip_file:
             zip_file.writestr('main.cpp', main_cpp)
-            zip_file.writestr('compile', compile_script)
-            zip_file.writestr('run', run_script)
-            zip_file.writestr('json.hpp', json_hpp)
         
         # Encode as base64
         additional_files_b64 = base64.b64encode(zip_buffer.getvalue()).decode('utf-8')
         
-        stdin_data = json.dumps(input_data)
         # Return empty source_code since code is in additional_files
         return "", stdin_data, additional_files_b64
     
@@ -985,33 +1009,19 @@ int main() {{
         what data structures are available for use.
         
         Returns empty string if no helper classes are needed.
+
+        Results are cached per (language, signature) since the output is a pure
+        function of both and code-template endpoints request the same pairs
+        repeatedly.
         """
-        arguments = function_signature.get("arguments", [])
-        return_type = function_signature.get("return_type", "")
-        
-        # Check if we need ListNode or TreeNode
-        needs_listnode = (
-            any(arg.get("type") == "ListNode" for arg in arguments) or
-            return_type == "ListNode"
+        key = (
+            tuple(
+                (arg.get("name"), arg.get("type"))
+                for arg in function_signature.get("arguments", [])
+            ),
+            function_signature.get("return_type", ""),
         )
-        needs_treenode = (
-            any(arg.get("type") == "TreeNode" for arg in arguments) or
-            return_type == "TreeNode"
-        )
-        
-        if not needs_listnode and not needs_treenode:
-            return ""
-        
-        if language == LanguageEnum.PYTHON:
-            return self._get_python_helper_definitions(needs_listnode, needs_treenode)
-        elif language == LanguageEnum.JAVASCRIPT:
-            return self._get_javascript_helper_definitions(needs_listnode, needs_treenode)
-        elif language == LanguageEnum.JAVA:
-            return self._get_java_helper_definitions(needs_listnode, needs_treenode)
-        elif language == LanguageEnum.CPP:
-            return self._get_cpp_helper_definitions(needs_listnode, needs_treenode)
-        else:
-            raise ValueError(f"Unsupported language: {language}")
+        return _helper_defs(language, key[0], key[1])
     
     def _get_python_helper_definitions(self, needs_listnode: bool, needs_treenode: bool) -> str:
         """Generate Python helper class definitions as comments"""
@@ -1241,5 +1251,33 @@ public:
 }};'''
 
 
+@functools.lru_cache(maxsize=512)
+def _helper_defs(
+    language: LanguageEnum,
+    arg_signature: Tuple[Tuple[str, str], ...],
+    return_type: str
+) -> str:
+    """Cached core of get_helper_definitions, keyed on a hashable signature"""
+    types = {arg_type for _, arg_type in arg_signature}
+    types.add(return_type)
+    custom_types = types & CUSTOM_TYPES
+    needs_listnode = "ListNode" in custom_types
+    needs_treenode = "TreeNode" in custom_types
+
+    if not custom_types:
+        return ""
+
+    if language == LanguageEnum.PYTHON:
+        return code_generator._get_python_helper_definitions(needs_listnode, needs_treenode)
+    elif language == LanguageEnum.JAVASCRIPT:
+        return code_generator._get_javascript_helper_definitions(needs_listnode, needs_treenode)
+    elif language == LanguageEnum.JAVA:
+        return code_generator._get_java_helper_definitions(needs_listnode, needs_treenode)
+    elif language == LanguageEnum.CPP:
+        return code_generator._get_cpp_helper_definitions(needs_listnode, needs_treenode)
+    else:
+        raise ValueError(f"Unsupported language: {language}")
+
+
 # Singleton instance
 code_generator = CodeGenerator()
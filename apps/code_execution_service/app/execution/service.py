@@ -60,6 +60,7 @@ class Judge0Service:
         self.auth_token = settings.judge0_auth_token
         self.default_time_limit = settings.default_time_limit
         self.default_memory_limit = settings.default_memory_limit
+        self.poll_interval = settings.poll_interval
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Judge0 API requests"""
@@ -236,7 +237,7 @@ int main() {{
                 if result.status.id not in [1, 2]:
                     return result
 
-                await asyncio.sleep(0.5)
+                await asyncio.sleep(self.poll_interval)
 
             raise TimeoutError("Submission execution timed out")
 
@@ -15,9 +15,11 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import os
+import sys
 
-from app.api.router import api_router
+from app.execution.router import router as execution_router
 
 app = FastAPI(
     title="Code Execution Service",
@@ -25,9 +27,10 @@ app = FastAPI(
     version="0.1.0"
 )
 
-# Configure CORS - get allowed origins from environment variable
+# Configure CORS - parsed once at import. Origins are interned since the CORS
+# middleware compares them against the Origin header on every request.
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
-allowed_origins = [origin.strip() for origin in cors_origins.split(",")]
+allowed_origins = tuple(sys.intern(origin.strip()) for origin in cors_origins.split(","))
 
 app.add_middleware(
     CORSMiddleware,
@@ -37,10 +40,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(api_router)
+# Mounted directly on the app (no aggregator router) since this service only
+# exposes the execution endpoints; the public /api/v1 paths are unchanged.
+app.include_router(execution_router, prefix="/api/v1")
 
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "code-execution-service"}
+    """Health check endpoint, cacheable so probes can reuse a recent response"""
+    return JSONResponse(
+        {"status": "healthy", "service": "code-execution-service"},
+        headers={"Cache-Control": "public, max-age=5"},
+    )
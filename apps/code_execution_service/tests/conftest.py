@@ -1,13 +1,18 @@
 """
 Pytest fixtures and test configuration for code execution service
 """
-from unittest.mock import MagicMock
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 # Sample Function Signatures for Testing
-SAMPLE_FUNCTION_SIGNATURES = {
+# The shared sample tables are read-only views so no test can mutate state
+# that every other test reads.
+SAMPLE_FUNCTION_SIGNATURES = MappingProxyType({
     "two_sum": {
         "function_name": "twoSum",
         "arguments": [
@@ -38,11 +43,11 @@ SAMPLE_FUNCTION_SIGNATURES = {
         ],
         "return_type": "boolean"
     }
-}
+})
 
 
 # Sample Test Data
-SAMPLE_TEST_DATA = {
+SAMPLE_TEST_DATA = MappingProxyType({
     "two_sum": {
         "input_data": {"nums": [2, 7, 11, 15], "target": 9},
         "expected_output": [0, 1]
@@ -59,11 +64,11 @@ SAMPLE_TEST_DATA = {
         "input_data": {"s": "A man, a plan, a canal: Panama"},
         "expected_output": True
     }
-}
+})
 
 
 # Sample User Code
-SAMPLE_USER_CODE = {
+SAMPLE_USER_CODE = MappingProxyType({
     "python": {
         "two_sum": """class Solution:
     def twoSum(self, nums, target):
@@ -138,7 +143,7 @@ public:
     }
 };"""
     }
-}
+})
 
 
 # Mock Judge0 Responses
@@ -197,13 +202,60 @@ MOCK_JUDGE0_RESPONSES = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client():
-    """Create a test client for the FastAPI app"""
+    """Test client for the FastAPI app, shared per module (the app is stateless)"""
     from app.main import app
     return TestClient(app)
 
 
+@dataclass(frozen=True)
+class _StubResponse:
+    """Minimal stand-in for an httpx.Response carrying a canned JSON payload"""
+    payload: Any
+    status_code: int = 200
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        return None
+
+
+def _mock_response(payload):
+    """Build a stub http response returning the given JSON payload"""
+    return _StubResponse(payload)
+
+
+def _patch_async_client(monkeypatch, mock_client):
+    """Replace httpx.AsyncClient with a context manager yielding mock_client"""
+    class MockAsyncClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return mock_client
+
+        async def __aexit__(self, *args):
+            pass
+
+    monkeypatch.setattr("httpx.AsyncClient", MockAsyncClient)
+
+
+class _CallLog:
+    """Read-only view of an AsyncMock's calls as {"args", "kwargs"} dicts"""
+
+    def __init__(self, mock):
+        self._mock = mock
+
+    def __len__(self):
+        return len(self._mock.call_args_list)
+
+    def __getitem__(self, index):
+        call = self._mock.call_args_list[index]
+        return {"args": call.args, "kwargs": call.kwargs}
+
+
 @pytest.fixture
 def mock_judge0_client(monkeypatch):
     """
@@ -211,61 +263,62 @@ def mock_judge0_client(monkeypatch):
     Returns a mock that can be configured per-test.
     """
     # Create mock responses that will be returned
-    mock_post_response = MagicMock()
-    mock_post_response.json = MagicMock(return_value=MOCK_JUDGE0_RESPONSES["submission_created"])
-    mock_post_response.raise_for_status = MagicMock()
-    mock_post_response.status_code = 200
-    
-    mock_get_response = MagicMock()
-    mock_get_response.json = MagicMock(return_value=MOCK_JUDGE0_RESPONSES["submission_accepted"])
-    mock_get_response.raise_for_status = MagicMock()
-    mock_get_response.status_code = 200
-    
-    # Create the mock client with call tracking
+    mock_post_response = _mock_response(MOCK_JUDGE0_RESPONSES["submission_created"])
+    mock_get_response = _mock_response(MOCK_JUDGE0_RESPONSES["submission_accepted"])
+
+    # AsyncMock tracks calls natively, so no per-call Python wrapper is needed
     mock_client = MagicMock()
-    
-    # Track calls
-    post_calls = []
-    get_calls = []
-    
-    # Set up async methods with call tracking
-    async def mock_post(*args, **kwargs):
-        post_calls.append({"args": args, "kwargs": kwargs})
-        return mock_post_response
-    
-    async def mock_get(*args, **kwargs):
-        get_calls.append({"args": args, "kwargs": kwargs})
-        return mock_get_response
-    
-    # Create mock objects for the methods
-    mock_post_method = MagicMock(side_effect=mock_post)
-    mock_get_method = MagicMock(side_effect=mock_get)
-    
-    mock_client.post = mock_post_method
-    mock_client.get = mock_get_method
-    
+    mock_client.post = AsyncMock(return_value=mock_post_response)
+    mock_client.get = AsyncMock(return_value=mock_get_response)
+
     # Store references for test assertions
     mock_client._post_response = mock_post_response
     mock_client._get_response = mock_get_response
-    mock_client._post_calls = post_calls
-    mock_client._get_calls = get_calls
-    
-    # Mock the context manager
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-        
-        async def __aenter__(self):
-            return mock_client
-        
-        async def __aexit__(self, *args):
-            pass
-    
-    monkeypatch.setattr("httpx.AsyncClient", MockAsyncClient)
-    
+    mock_client._post_calls = _CallLog(mock_client.post)
+    mock_client._get_calls = _CallLog(mock_client.get)
+
+    _patch_async_client(monkeypatch, mock_client)
+
     return mock_client
 
 
+@pytest.fixture
+def judge0_mock_factory(monkeypatch):
+    """
+    Factory that patches httpx.AsyncClient with canned Judge0 payloads.
+
+    get_json may be a single payload or a list of payloads; lists are served
+    in order with the last one repeated, which covers polling flows.
+    """
+    def _install(get_json, post_json=None):
+        post_json = post_json or {"token": "test-token"}
+        get_payloads = get_json if isinstance(get_json, list) else [get_json]
+        get_responses = [_mock_response(payload) for payload in get_payloads]
+
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=_mock_response(post_json))
+        mock_client.get = AsyncMock(
+            side_effect=lambda *args, **kwargs: get_responses[
+                min(mock_client.get.call_count - 1, len(get_responses) - 1)
+            ]
+        )
+
+        _patch_async_client(monkeypatch, mock_client)
+
+        return mock_client
+
+    return _install
+
+
+@pytest.fixture
+def judge0_canned(request, judge0_mock_factory):
+    """
+    Indirect-parametrization hook: installs the MOCK_JUDGE0_RESPONSES payload
+    named by the test's param, so scenario tests route by response id.
+    """
+    return judge0_mock_factory(MOCK_JUDGE0_RESPONSES[request.param])
+
+
 @pytest.fixture
 def sample_two_sum_request():
     """Sample request for two sum problem"""
@@ -9,10 +9,36 @@ from io import BytesIO
 
 import pytest
 
-from app.execution.code_generator import LanguageEnum
+from app.execution.code_generator import CodeGenerator, LanguageEnum
 from tests.conftest import SAMPLE_FUNCTION_SIGNATURES, SAMPLE_TEST_DATA, SAMPLE_USER_CODE
 
 
+@pytest.fixture(scope="module")
+def java_bundle():
+    """Pre-decoded Java two-sum bundle shared across the Java tests"""
+    wrapper_code, stdin, additional_files = CodeGenerator().generate_wrapper(
+        language=LanguageEnum.JAVA,
+        user_code=SAMPLE_USER_CODE["java"]["two_sum"],
+        function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
+        input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
+    )
+    zip_file = zipfile.ZipFile(BytesIO(base64.b64decode(additional_files)))
+    return wrapper_code, stdin, additional_files, zip_file
+
+
+@pytest.fixture(scope="module")
+def cpp_bundle():
+    """Pre-decoded C++ two-sum bundle shared across the C++ tests"""
+    wrapper_code, stdin, additional_files = CodeGenerator().generate_wrapper(
+        language=LanguageEnum.CPP,
+        user_code=SAMPLE_USER_CODE["cpp"]["two_sum"],
+        function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
+        input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
+    )
+    zip_file = zipfile.ZipFile(BytesIO(base64.b64decode(additional_files)))
+    return wrapper_code, stdin, additional_files, zip_file
+
+
 class TestCodeGeneratorPython:
     """Test Python code generation"""
     
@@ -144,54 +170,37 @@ class TestCodeGeneratorJavaScript:
 class TestCodeGeneratorJava:
     """Test Java code generation"""
     
-    def test_java_simple_function(self, code_generator):
+    def test_java_simple_function(self, java_bundle):
         """Test Java wrapper for simple function"""
-        wrapper_code, stdin, additional_files = code_generator.generate_wrapper(
-            language=LanguageEnum.JAVA,
-            user_code=SAMPLE_USER_CODE["java"]["two_sum"],
-            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
-            input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
-        )
-        
+        wrapper_code, stdin, additional_files, zip_file = java_bundle
+
         # For Java, should return stdin and additional_files (zip with libraries)
         assert wrapper_code == ""  # Empty for multi-file programs
         assert stdin is not None
         assert additional_files is not None
-        
+
         # Additional files should be base64 encoded
         assert isinstance(additional_files, str)
-        
-        # Decode and verify zip contents
-        zip_bytes = base64.b64decode(additional_files)
-        zip_file = zipfile.ZipFile(BytesIO(zip_bytes))
+
         filenames = zip_file.namelist()
-        
+
         # Should contain Main.java and GSON library
         assert "Main.java" in filenames
         assert any("gson" in f.lower() for f in filenames)
-        
+
         # Main.java should include user code
         main_java = zip_file.read("Main.java").decode("utf-8")
         assert "class Solution" in main_java
         assert "twoSum" in main_java
-    
-    def test_java_includes_gson_library(self, code_generator):
+
+    def test_java_includes_gson_library(self, java_bundle):
         """Test Java wrapper includes GSON library for JSON handling"""
-        wrapper_code, stdin, additional_files = code_generator.generate_wrapper(
-            language=LanguageEnum.JAVA,
-            user_code=SAMPLE_USER_CODE["java"]["two_sum"],
-            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
-            input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
-        )
-        
-        # Decode zip
-        zip_bytes = base64.b64decode(additional_files)
-        zip_file = zipfile.ZipFile(BytesIO(zip_bytes))
-        
+        wrapper_code, stdin, additional_files, zip_file = java_bundle
+
         # Should have GSON jar
         gson_files = [f for f in zip_file.namelist() if "gson" in f.lower() and f.endswith(".jar")]
         assert len(gson_files) > 0
-        
+
         # Main.java should import GSON
         main_java = zip_file.read("Main.java").decode("utf-8")
         assert "import com.google.gson" in main_java
@@ -200,47 +209,30 @@ class TestCodeGeneratorJava:
 class TestCodeGeneratorCpp:
     """Test C++ code generation"""
     
-    def test_cpp_simple_function(self, code_generator):
+    def test_cpp_simple_function(self, cpp_bundle):
         """Test C++ wrapper for simple function"""
-        wrapper_code, stdin, additional_files = code_generator.generate_wrapper(
-            language=LanguageEnum.CPP,
-            user_code=SAMPLE_USER_CODE["cpp"]["two_sum"],
-            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
-            input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
-        )
-        
+        wrapper_code, stdin, additional_files, zip_file = cpp_bundle
+
         # For C++, should return stdin and additional_files (zip with libraries)
         assert wrapper_code == ""  # Empty for multi-file programs
         assert stdin is not None
         assert additional_files is not None
-        
-        # Decode and verify zip contents
-        zip_bytes = base64.b64decode(additional_files)
-        zip_file = zipfile.ZipFile(BytesIO(zip_bytes))
+
         filenames = zip_file.namelist()
-        
+
         # Should contain main.cpp and nlohmann/json library
         assert "main.cpp" in filenames
         assert any("json.hpp" in f for f in filenames)
-        
+
         # main.cpp should include user code
         main_cpp = zip_file.read("main.cpp").decode("utf-8")
         assert "class Solution" in main_cpp
         assert "twoSum" in main_cpp
-    
-    def test_cpp_includes_json_library(self, code_generator):
+
+    def test_cpp_includes_json_library(self, cpp_bundle):
         """Test C++ wrapper includes nlohmann/json library"""
-        wrapper_code, stdin, additional_files = code_generator.generate_wrapper(
-            language=LanguageEnum.CPP,
-            user_code=SAMPLE_USER_CODE["cpp"]["two_sum"],
-            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
-            input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
-        )
-        
-        # Decode zip
-        zip_bytes = base64.b64decode(additional_files)
-        zip_file = zipfile.ZipFile(BytesIO(zip_bytes))
-        
+        wrapper_code, stdin, additional_files, zip_file = cpp_bundle
+
         # Should have json.hpp
         assert "json.hpp" in zip_file.namelist()
         
@@ -329,10 +321,28 @@ class TestCodeGeneratorEdgeCases:
             function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
             input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
         )
-        
-        # Should still generate wrapper
-        assert wrapper_code is not None
-        assert stdin is not None
+
+        # The full harness must still be emitted: Judge0 rejects blank
+        # source, so execution has to reach the missing-function call and
+        # fail with a structured runtime error
+        assert "twoSum" in wrapper_code
+        assert stdin
+        assert additional_files is None
+
+    def test_empty_user_code_compiled_language(self, code_generator):
+        """Test that empty user code still produces the compiled-language bundle"""
+        wrapper_code, stdin, additional_files = code_generator.generate_wrapper(
+            language=LanguageEnum.JAVA,
+            user_code="",
+            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
+            input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"]
+        )
+
+        # Java ships its source inside the zip bundle, which must be built
+        # even for an empty submission so compilation fails deterministically
+        assert wrapper_code == ""
+        assert stdin
+        assert additional_files is not None
     
     def test_complex_input_data(self, code_generator):
         """Test handling of complex nested input data"""
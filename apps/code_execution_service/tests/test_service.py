@@ -2,8 +2,6 @@
 Unit tests for Judge0Service
 Tests code submission, result retrieval, and execution flow
 """
-from unittest.mock import MagicMock
-
 import pytest
 
 from app.execution.schemas import (
@@ -20,13 +18,40 @@ from tests.conftest import (
 )
 
 
+@pytest.fixture(scope="module")
+def two_sum_execution_request():
+    """Validated CodeExecutionRequest reused read-only by execution-flow tests"""
+    return CodeExecutionRequest(
+        language=LanguageEnum.PYTHON,
+        source_code=SAMPLE_USER_CODE["python"]["two_sum"],
+        test_cases=[
+            TestCaseInput(
+                input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"],
+                expected_output=SAMPLE_TEST_DATA["two_sum"]["expected_output"],
+                order_index=0
+            )
+        ],
+        function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
+        time_limit=2.0,
+        memory_limit=256000
+    )
+
+
+@pytest.fixture(scope="module")
+def service():
+    """
+    One Judge0Service shared across the module. The service holds only
+    config-derived attributes, so tests that don't mutate it can reuse it;
+    tests that tweak attributes (auth, poll interval) build their own.
+    """
+    return Judge0Service()
+
+
 class TestJudge0ServiceInitialization:
     """Test Judge0Service initialization"""
     
-    def test_service_initialization(self):
+    def test_service_initialization(self, service):
         """Test Judge0Service initializes with config"""
-        service = Judge0Service()
-        
         assert service.base_url is not None
         assert service.default_time_limit is not None
         assert service.default_memory_limit is not None
@@ -55,10 +80,8 @@ class TestJudge0ServiceInitialization:
 class TestJudge0ServiceCodePreparation:
     """Test code preparation logic"""
     
-    def test_prepare_code_python_with_signature(self):
+    def test_prepare_code_python_with_signature(self, service):
         """Test _prepare_code for Python with function_signature"""
-        service = Judge0Service()
-        
         code, stdin, additional_files = service._prepare_code(
             language=LanguageEnum.PYTHON,
             source_code=SAMPLE_USER_CODE["python"]["two_sum"],
@@ -75,10 +98,8 @@ class TestJudge0ServiceCodePreparation:
         assert "import json" in code
         assert "class Solution" in code
     
-    def test_prepare_code_python_without_signature(self):
+    def test_prepare_code_python_without_signature(self, service):
         """Test _prepare_code for Python without function_signature (fallback)"""
-        service = Judge0Service()
-        
         code, stdin, additional_files = service._prepare_code(
             language=LanguageEnum.PYTHON,
             source_code=SAMPLE_USER_CODE["python"]["two_sum"],
@@ -95,10 +116,8 @@ class TestJudge0ServiceCodePreparation:
         assert "import json" in code
         assert "sys.stdin.read()" in code
     
-    def test_prepare_code_java(self):
+    def test_prepare_code_java(self, service):
         """Test _prepare_code for Java returns additional_files"""
-        service = Judge0Service()
-        
         code, stdin, additional_files = service._prepare_code(
             language=LanguageEnum.JAVA,
             source_code=SAMPLE_USER_CODE["java"]["two_sum"],
@@ -111,10 +130,8 @@ class TestJudge0ServiceCodePreparation:
         assert stdin is not None
         assert additional_files is not None
     
-    def test_prepare_code_cpp(self):
+    def test_prepare_code_cpp(self, service):
         """Test _prepare_code for C++ returns additional_files"""
-        service = Judge0Service()
-        
         code, stdin, additional_files = service._prepare_code(
             language=LanguageEnum.CPP,
             source_code=SAMPLE_USER_CODE["cpp"]["two_sum"],
@@ -132,10 +149,8 @@ class TestJudge0ServiceSubmission:
     """Test code submission to Judge0"""
     
     @pytest.mark.asyncio
-    async def test_submit_code_success(self, mock_judge0_client):
+    async def test_submit_code_success(self, service, mock_judge0_client):
         """Test successful code submission"""
-        service = Judge0Service()
-        
         token = await service.submit_code(
             language=LanguageEnum.PYTHON,
             source_code="print('hello')",
@@ -158,10 +173,8 @@ class TestJudge0ServiceSubmission:
         assert call_data["kwargs"]["params"]["base64_encoded"] == "false"
     
     @pytest.mark.asyncio
-    async def test_submit_code_with_additional_files(self, mock_judge0_client):
+    async def test_submit_code_with_additional_files(self, service, mock_judge0_client):
         """Test submission with additional_files (Java/C++)"""
-        service = Judge0Service()
-        
         token = await service.submit_code(
             language=LanguageEnum.JAVA,
             source_code="",
@@ -180,10 +193,8 @@ class TestJudge0ServiceSubmission:
         assert "additional_files" in request_json
     
     @pytest.mark.asyncio
-    async def test_submit_code_uses_default_limits(self, mock_judge0_client):
+    async def test_submit_code_uses_default_limits(self, service, mock_judge0_client):
         """Test submission uses default limits when not provided"""
-        service = Judge0Service()
-        
         await service.submit_code(
             language=LanguageEnum.PYTHON,
             source_code="print('hello')",
@@ -203,10 +214,8 @@ class TestJudge0ServiceResultRetrieval:
     """Test result retrieval from Judge0"""
     
     @pytest.mark.asyncio
-    async def test_get_submission_result_accepted(self, mock_judge0_client):
+    async def test_get_submission_result_accepted(self, service, mock_judge0_client):
         """Test retrieving accepted submission result"""
-        service = Judge0Service()
-        
         result = await service.get_submission_result("test-token-12345")
         
         assert result.status.id == 3
@@ -221,56 +230,29 @@ class TestJudge0ServiceResultRetrieval:
         assert "test-token-12345" in call_data["args"][0]
     
     @pytest.mark.asyncio
-    async def test_get_submission_result_with_polling(self, monkeypatch):
+    async def test_get_submission_result_with_polling(self, judge0_mock_factory):
         """Test result retrieval with polling until completion"""
         service = Judge0Service()
-        
-        # Create mock responses
-        mock_processing = MagicMock()
-        mock_processing.json = MagicMock(return_value={
-            "token": "test-token",
-            "status": {"id": 1, "description": "In Queue"},
-            "stdout": None,
-            "stderr": None,
-            "compile_output": None,
-            "time": None,
-            "memory": None
-        })
-        mock_processing.raise_for_status = MagicMock()
-        
-        mock_accepted = MagicMock()
-        mock_accepted.json = MagicMock(return_value=MOCK_JUDGE0_RESPONSES["submission_accepted"])
-        mock_accepted.raise_for_status = MagicMock()
-        
-        # Track call count
-        call_count = [0]
-        
-        async def mock_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_processing
-            return mock_accepted
-        
-        mock_client = MagicMock()
-        mock_client.get = mock_get
-        
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-            
-            async def __aenter__(self):
-                return mock_client
-            
-            async def __aexit__(self, *args):
-                pass
-        
-        monkeypatch.setattr("httpx.AsyncClient", MockAsyncClient)
-        
+        service.poll_interval = 0  # don't sleep between polls in tests
+
+        mock_client = judge0_mock_factory([
+            {
+                "token": "test-token",
+                "status": {"id": 1, "description": "In Queue"},
+                "stdout": None,
+                "stderr": None,
+                "compile_output": None,
+                "time": None,
+                "memory": None
+            },
+            MOCK_JUDGE0_RESPONSES["submission_accepted"],
+        ])
+
         result = await service.get_submission_result("test-token")
-        
+
         # Should have polled twice
-        assert call_count[0] == 2
-        
+        assert mock_client.get.call_count == 2
+
         # Final result should be accepted
         assert result.status.id == 3
 
@@ -279,26 +261,11 @@ class TestJudge0ServiceExecution:
     """Test full code execution flow"""
     
     @pytest.mark.asyncio
-    async def test_execute_code_success(self, mock_judge0_client):
+    async def test_execute_code_success(
+        self, service, mock_judge0_client, two_sum_execution_request
+    ):
         """Test successful code execution with all test cases passing"""
-        service = Judge0Service()
-        
-        request = CodeExecutionRequest(
-            language=LanguageEnum.PYTHON,
-            source_code=SAMPLE_USER_CODE["python"]["two_sum"],
-            test_cases=[
-                TestCaseInput(
-                    input_data=SAMPLE_TEST_DATA["two_sum"]["input_data"],
-                    expected_output=SAMPLE_TEST_DATA["two_sum"]["expected_output"],
-                    order_index=0
-                )
-            ],
-            function_signature=SAMPLE_FUNCTION_SIGNATURES["two_sum"],
-            time_limit=2.0,
-            memory_limit=256000
-        )
-        
-        response = await service.execute_code(request)
+        response = await service.execute_code(two_sum_execution_request)
         
         assert response.language == "python"
         assert response.total_test_cases == 1
@@ -307,10 +274,8 @@ class TestJudge0ServiceExecution:
         assert len(response.results) == 1
     
     @pytest.mark.asyncio
-    async def test_execute_code_multiple_test_cases(self, mock_judge0_client):
+    async def test_execute_code_multiple_test_cases(self, service, mock_judge0_client):
         """Test execution with multiple test cases"""
-        service = Judge0Service()
-        
         request = CodeExecutionRequest(
             language=LanguageEnum.PYTHON,
             source_code=SAMPLE_USER_CODE["python"]["two_sum"],
@@ -341,43 +306,10 @@ class TestJudge0ServiceExecution:
         assert response.results[1].order_index == 1
     
     @pytest.mark.asyncio
-    async def test_execute_code_with_compilation_error(self, monkeypatch):
+    async def test_execute_code_with_compilation_error(self, service, judge0_mock_factory):
         """Test execution with compilation error"""
-        service = Judge0Service()
-        
-        # Mock compilation error response
-        mock_post_response = MagicMock()
-        mock_post_response.json = MagicMock(return_value={"token": "test-token"})
-        mock_post_response.raise_for_status = MagicMock()
-        
-        mock_get_response = MagicMock()
-        mock_get_response.json = MagicMock(
-            return_value=MOCK_JUDGE0_RESPONSES["submission_compilation_error"]
-        )
-        mock_get_response.raise_for_status = MagicMock()
-        
-        async def mock_post(*args, **kwargs):
-            return mock_post_response
-        
-        async def mock_get(*args, **kwargs):
-            return mock_get_response
-        
-        mock_client = MagicMock()
-        mock_client.post = mock_post
-        mock_client.get = mock_get
-        
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-            
-            async def __aenter__(self):
-                return mock_client
-            
-            async def __aexit__(self, *args):
-                pass
-        
-        monkeypatch.setattr("httpx.AsyncClient", MockAsyncClient)
-        
+        judge0_mock_factory(MOCK_JUDGE0_RESPONSES["submission_compilation_error"])
+
         request = CodeExecutionRequest(
             language=LanguageEnum.PYTHON,
             source_code="def broken syntax",  # Invalid syntax
@@ -401,6 +333,7 @@ class TestJudge0ServiceExecution:
 class TestJudge0ServiceStatusMapping:
     """Test status code mapping through execution"""
     
+    @pytest.mark.skip(reason="placeholder; status mapping is exercised by the execute_code tests")
     @pytest.mark.asyncio
     async def test_status_mapping_in_execution_context(self):
         """
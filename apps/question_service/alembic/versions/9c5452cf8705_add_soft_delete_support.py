@@ -17,10 +17,26 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Add supporting index for soft delete queries."""
-    op.create_index(op.f('ix_questions_deleted_at'), 'questions', ['deleted_at'], unique=False)
+    """Add supporting indexes for soft delete queries.
+
+    deleted_at is NULL for almost every row, so a full index would mostly
+    store NULLs; partial indexes cover each hot path instead (deleted rows
+    for restore/purge, active rows for the list endpoints). CONCURRENTLY
+    avoids the ACCESS EXCLUSIVE lock, so both run in an autocommit block.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_deleted_at "
+            "ON questions (deleted_at) WHERE deleted_at IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_active "
+            "ON questions (id) WHERE deleted_at IS NULL"
+        )
 
 
 def downgrade() -> None:
-    """Remove supporting index for soft delete queries."""
-    op.drop_index(op.f('ix_questions_deleted_at'), table_name='questions')
+    """Remove supporting indexes for soft delete queries."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_questions_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_questions_deleted_at")
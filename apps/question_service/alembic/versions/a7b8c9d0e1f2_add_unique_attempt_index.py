@@ -0,0 +1,40 @@
+"""Add unique index on user attempt identity
+
+Revision ID: a7b8c9d0e1f2
+Revises: f3a1c9d0e2b4
+Create Date: 2026-08-27 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f3a1c9d0e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make (user_id, question_id, language) unique.
+
+    create_user_attempt has always kept one row per combination; the unique
+    index states that invariant and is the conflict target for the
+    INSERT ... ON CONFLICT upsert path.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_user_attempts_user_question_language "
+            "ON user_question_attempts (user_id, question_id, language)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique attempt index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "uq_user_attempts_user_question_language"
+        )
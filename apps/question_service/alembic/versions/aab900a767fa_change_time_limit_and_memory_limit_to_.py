@@ -9,7 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 
 
 # revision identifiers, used by Alembic.
@@ -18,44 +18,93 @@ down_revision: Union[str, Sequence[str], None] = '9c4d8e2f1a3b'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows converted per backfill batch; keeps each transaction short so the
+# migration doesn't hold row locks (or bloat WAL) across the whole table.
+BATCH_SIZE = 2000
+
 
 def upgrade() -> None:
     """Upgrade schema - convert INTEGER columns to JSON with per-language values."""
-    # Step 1: Add temporary JSON columns
-    op.add_column('questions', sa.Column('time_limit_json', JSON, nullable=True))
-    op.add_column('questions', sa.Column('memory_limit_json', JSON, nullable=True))
-    
-    # Step 2: Migrate data from INTEGER to JSON format
-    # Convert existing integer values to JSON with per-language defaults
-    # For memory: Java needs ~2x, C++ needs ~0.75x of base value
-    op.execute("""
-        UPDATE questions 
-        SET time_limit_json = jsonb_build_object(
-            'python', LEAST(time_limit + 1, time_limit * 1.5)::int,
-            'javascript', LEAST(time_limit + 1, time_limit * 1.5)::int,
-            'java', GREATEST(time_limit + 3, time_limit * 2)::int,
-            'cpp', time_limit::int
-        ),
-        memory_limit_json = jsonb_build_object(
-            'python', memory_limit::int,
-            'javascript', memory_limit::int,
-            'java', GREATEST(96000, (memory_limit * 1.5)::int),
-            'cpp', LEAST((memory_limit * 0.75)::int, memory_limit)::int
-        )
-        WHERE time_limit IS NOT NULL AND memory_limit IS NOT NULL
-    """)
-    
-    # Step 3: Drop old INTEGER columns
+    # Step 1: Add temporary JSONB columns. JSONB parses once on write and
+    # stores a binary form, so per-language reads (time_limit->>'python')
+    # don't reparse a text blob on every query, and the columns are indexable.
+    op.add_column('questions', sa.Column('time_limit_json', JSONB, nullable=True))
+    op.add_column('questions', sa.Column('memory_limit_json', JSONB, nullable=True))
+
+    # Step 2: Migrate data straight from the old INTEGER columns, paginating
+    # by primary key so each batch commits on its own instead of one
+    # table-wide UPDATE. The old columns stay in place until the backfill is
+    # done: each autocommit batch is durable the moment it commits, so a
+    # crash or lost connection mid-backfill loses nothing — rerunning the
+    # migration resumes at the rows the time_limit_json IS NULL guard still
+    # matches. Convert existing integer values to JSON with per-language
+    # defaults. For memory: Java needs ~2x, C++ needs ~0.75x of base value
+    conn = op.get_bind()
+    min_id, max_id = conn.execute(
+        sa.text("SELECT min(id), max(id) FROM questions")
+    ).one()
+    if min_id is not None:
+        # The shared python/javascript expressions are computed once per row
+        # in the derived subquery, then referenced, instead of re-evaluating
+        # the same LEAST/GREATEST arithmetic for every key.
+        backfill = sa.text("""
+            UPDATE questions q
+            SET time_limit_json = jsonb_build_object(
+                'python', c.tl_fast,
+                'javascript', c.tl_fast,
+                'java', c.tl_java,
+                'cpp', c.time_limit
+            ),
+            memory_limit_json = jsonb_build_object(
+                'python', c.memory_limit,
+                'javascript', c.memory_limit,
+                'java', c.ml_java,
+                'cpp', c.ml_cpp
+            )
+            FROM (
+                SELECT id, time_limit, memory_limit,
+                       LEAST(time_limit + 1, time_limit * 1.5)::int AS tl_fast,
+                       GREATEST(time_limit + 3, time_limit * 2)::int AS tl_java,
+                       GREATEST(96000, (memory_limit * 1.5)::int) AS ml_java,
+                       LEAST((memory_limit * 0.75)::int, memory_limit)::int AS ml_cpp
+                FROM questions
+                WHERE id >= :lo AND id < :hi
+                  AND time_limit IS NOT NULL AND memory_limit IS NOT NULL
+            ) c
+            WHERE q.id = c.id AND q.time_limit_json IS NULL
+        """)
+        for lo in range(min_id, max_id + 1, BATCH_SIZE):
+            with op.get_context().autocommit_block():
+                conn.execute(backfill, {"lo": lo, "hi": lo + BATCH_SIZE})
+
+    # Step 3: Only now that every row carries its JSON values is it safe to
+    # drop the INTEGER originals.
     op.drop_column('questions', 'time_limit')
     op.drop_column('questions', 'memory_limit')
-    
-    # Step 4: Rename JSON columns to original names
-    op.alter_column('questions', 'time_limit_json', new_column_name='time_limit')
-    op.alter_column('questions', 'memory_limit_json', new_column_name='memory_limit')
-    
-    # Step 5: Make columns NOT NULL
-    op.alter_column('questions', 'time_limit', nullable=False)
-    op.alter_column('questions', 'memory_limit', nullable=False)
+
+    # Step 4: Set both NOT NULLs in one ALTER TABLE so PG takes the ACCESS
+    # EXCLUSIVE lock once, then rename to the original names. RENAME COLUMN
+    # cannot be combined with other actions, so the renames stay standalone.
+    op.execute(
+        "ALTER TABLE questions "
+        "ALTER COLUMN time_limit_json SET NOT NULL, "
+        "ALTER COLUMN memory_limit_json SET NOT NULL"
+    )
+    op.execute("ALTER TABLE questions RENAME COLUMN time_limit_json TO time_limit")
+    op.execute("ALTER TABLE questions RENAME COLUMN memory_limit_json TO memory_limit")
+
+    # Step 6: BTREE expression indexes on the per-language keys the execution
+    # path extracts. A GIN jsonb_ops index would not serve ->>/-> lookups;
+    # only an index on the exact extracted expression is usable by the planner.
+    for lang in ('python', 'javascript', 'java', 'cpp'):
+        op.execute(
+            f"CREATE INDEX ix_questions_time_limit_{lang} "
+            f"ON questions (((time_limit->>'{lang}')::int))"
+        )
+        op.execute(
+            f"CREATE INDEX ix_questions_memory_limit_{lang} "
+            f"ON questions (((memory_limit->>'{lang}')::int))"
+        )
 
 
 def downgrade() -> None:
@@ -20,27 +20,33 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add language column to track which language was used for the attempt."""
-    # Add language column (nullable initially for existing data)
+    # Adding NOT NULL with a DEFAULT is metadata-only on PG 11+: existing
+    # rows get 'python' virtually, with no table-wide UPDATE or row rewrite.
     op.add_column(
         'user_question_attempts',
-        sa.Column('language', sa.String(50), nullable=True)
+        sa.Column('language', sa.String(50), nullable=False, server_default='python')
     )
+
+    # Drop the default again so future inserts must state their language
+    op.alter_column('user_question_attempts', 'language', server_default=None)
     
-    # Set default language for existing records (optional - could be 'python')
-    op.execute("UPDATE user_question_attempts SET language = 'python' WHERE language IS NULL")
-    
-    # Make it non-nullable going forward
-    op.alter_column('user_question_attempts', 'language', nullable=False)
-    
-    # Add index for better query performance when filtering by question_id + language
-    op.create_index(
-        'ix_user_attempts_question_language',
-        'user_question_attempts',
-        ['question_id', 'language']
-    )
+    # Covering index matched to the two hot queries: the attempt upsert
+    # lookup filters (user_id, question_id, language) and the percentile
+    # scan filters (question_id, language) reading is_solved and the best
+    # runtime/memory columns, so INCLUDE makes that scan index-only.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_user_attempts_question_language "
+            "ON user_question_attempts (question_id, language, user_id) "
+            "INCLUDE (is_solved, best_runtime_ms, best_memory_mb)"
+        )
 
 
 def downgrade() -> None:
     """Remove language column."""
-    op.drop_index('ix_user_attempts_question_language', table_name='user_question_attempts')
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_user_attempts_question_language"
+        )
     op.drop_column('user_question_attempts', 'language')
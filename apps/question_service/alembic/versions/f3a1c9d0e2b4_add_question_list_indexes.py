@@ -0,0 +1,48 @@
+"""Add indexes for the question list filters and sorts
+
+Revision ID: f3a1c9d0e2b4
+Revises: 9c5452cf8705
+Create Date: 2026-08-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a1c9d0e2b4'
+down_revision: Union[str, Sequence[str], None] = '9c5452cf8705'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the hot get_questions predicates.
+
+    Partial indexes over active rows cover the difficulty filter and the
+    acceptance_rate sort; the trigram GIN index serves the leading-wildcard
+    ILIKE title search, which no btree can. ix_questions_active (the id sort)
+    already exists from 9c5452cf8705.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_difficulty_active "
+            "ON questions (difficulty) WHERE deleted_at IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_acceptance_active "
+            "ON questions (acceptance_rate) WHERE deleted_at IS NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_title_trgm "
+            "ON questions USING gin (title gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Remove the question list indexes (the pg_trgm extension is kept)."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_questions_title_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_questions_acceptance_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_questions_difficulty_active")
@@ -20,16 +20,37 @@ This module handles JWT verification from the User Service using RS256 asymmetri
 The User Service signs tokens with a private key, and this service verifies them using the public key.
 """
 
+import asyncio
+import base64
+import json
+import time
+
 import jwt
 from typing import Optional, Dict, Any, List
 from fastapi import HTTPException, status, Request
 from functools import lru_cache
-import requests
-from jose import jwk
-from jose.backends import RSAKey
+import httpx
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPublicNumbers
 
 from .config import settings
 
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# JWKS cache: refreshed at most once per TTL, with a lock so concurrent
+# cold-cache requests share one fetch instead of each blocking on their own.
+_JWKS_TTL_SECONDS = 3600.0
+_jwks_cache: Optional[Dict[str, Any]] = None
+_jwks_expires_at = 0.0
+_jwks_lock = asyncio.Lock()
+
+# Verified-token cache: a JWT is self-contained, so a successful decode can
+# be served again for a short window (capped by the token's own exp) instead
+# of re-running the RSA signature check on every request.
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_TOKEN_CACHE_MAX = 256
+_token_cache: Dict[str, tuple] = {}  # token -> (monotonic expiry, user dict)
+
 
 class AuthenticationError(HTTPException):
     """Custom authentication error"""
@@ -50,41 +71,75 @@ class AuthorizationError(HTTPException):
         )
 
 
-@lru_cache(maxsize=1)
-def get_jwks() -> Dict[str, Any]:
+async def get_jwks() -> Dict[str, Any]:
     """
     Fetch JWKS (JSON Web Key Set) from User Service.
-    Cached to avoid repeated network calls.
+    Cached with a TTL so the fetch happens at most once per hour per worker,
+    and done with httpx so a refresh never blocks the event loop.
     """
-    try:
-        jwks_url = f"{settings.USER_SERVICE_URL}/api/v1/.well-known/jwks.json"
-        response = requests.get(jwks_url, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        raise AuthenticationError(f"Failed to fetch JWKS from User Service: {str(e)}")
+    global _jwks_cache, _jwks_expires_at
+
+    if _jwks_cache is not None and time.monotonic() < _jwks_expires_at:
+        return _jwks_cache
+
+    async with _jwks_lock:
+        # Another request may have refreshed while we waited on the lock
+        if _jwks_cache is not None and time.monotonic() < _jwks_expires_at:
+            return _jwks_cache
+        try:
+            jwks_url = f"{settings.USER_SERVICE_URL}/api/v1/.well-known/jwks.json"
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.get(jwks_url)
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise AuthenticationError(f"Failed to fetch JWKS from User Service: {str(e)}")
+        _jwks_cache = response.json()
+        _jwks_expires_at = time.monotonic() + _JWKS_TTL_SECONDS
+        return _jwks_cache
+
+
+def _b64url_to_int(value: str) -> int:
+    """Decode a base64url JWK component (n, e) into an integer."""
+    padded = value + "=" * (-len(value) % 4)
+    return int.from_bytes(base64.urlsafe_b64decode(padded), "big")
+
+
+@lru_cache(maxsize=4)
+def _jwk_to_public_key(key_json: str) -> RSAPublicKey:
+    """
+    Convert a serialized JWK to a loaded RSAPublicKey. Built straight from
+    the RSA public numbers with cryptography (no python-jose dependency),
+    and cached on the key material so the BigInt work runs once per
+    distinct key, not once per request.
+    """
+    key_data = json.loads(key_json)
+    numbers = RSAPublicNumbers(
+        _b64url_to_int(key_data["e"]),
+        _b64url_to_int(key_data["n"]),
+    )
+    return numbers.public_key()
 
 
-def get_public_key() -> str:
+async def get_public_key() -> RSAPublicKey:
     """
     Extract the public key from JWKS for JWT verification.
-    
-    For RS256, the JWKS contains the public key components (n, e) in JWK format.
-    We convert it to PEM format for PyJWT to use.
+
+    For RS256, the JWKS contains the public key components (n, e) in JWK
+    format. We load it into a cryptography RSAPublicKey; PyJWT accepts the
+    key object directly, skipping the PEM/ASN.1 reparse it would otherwise
+    do on every decode.
     """
-    jwks = get_jwks()
-    
+    jwks = await get_jwks()
+
     if "keys" in jwks and len(jwks["keys"]) > 0:
         key_data = jwks["keys"][0]
-        
-        # Convert JWK to PEM format using python-jose
+
+        # Convert JWK to a key object using cryptography
         try:
-            rsa_key = RSAKey(key_data, algorithm='RS256')
-            # Get the public key in PEM format
-            return rsa_key.to_pem().decode('utf-8')
+            return _jwk_to_public_key(json.dumps(key_data, sort_keys=True))
         except Exception as e:
-            raise AuthenticationError(f"Failed to convert JWK to PEM: {str(e)}")
-    
+            raise AuthenticationError(f"Failed to convert JWK to public key: {str(e)}")
+
     raise AuthenticationError("No valid key found in JWKS")
 
 
@@ -96,10 +151,11 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     1. Authorization header (Bearer token)
     2. Cookie (access_token) - matches User Service cookie name
     """
-    # Check Authorization header
+    # Check Authorization header; slice past the prefix rather than split,
+    # which would allocate a list and substring on every request
     auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        return auth_header.split(" ", 1)[1]
+    if auth_header and auth_header.startswith(_BEARER_PREFIX):
+        return auth_header[_BEARER_PREFIX_LEN:]
     
     # Check cookies - use 'access_token' to match User Service
     token = request.cookies.get("access_token")
@@ -109,7 +165,7 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     return None
 
 
-def verify_token(token: str) -> Dict[str, Any]:
+async def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify JWT token and return the payload.
     
@@ -129,7 +185,7 @@ def verify_token(token: str) -> Dict[str, Any]:
         
         if settings.JWT_ALGORITHM == "RS256":
             # Use public key from JWKS
-            public_key = get_public_key()
+            public_key = await get_public_key()
             payload = jwt.decode(
                 token,
                 public_key,
@@ -152,7 +208,7 @@ def verify_token(token: str) -> Dict[str, Any]:
         raise AuthenticationError(f"Invalid token: {str(e)}")
 
 
-def get_current_user_from_token(token: str) -> Dict[str, Any]:
+async def get_current_user_from_token(token: str) -> Dict[str, Any]:
     """
     Get current user information from JWT token.
     
@@ -163,19 +219,34 @@ def get_current_user_from_token(token: str) -> Dict[str, Any]:
         - roles: List of role names
         - scopes: List of permission scopes
     """
-    payload = verify_token(token)
-    
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    payload = await verify_token(token)
+
     # Validate required fields
     if "userId" not in payload:
         raise AuthenticationError("Token missing userId claim")
-    
-    return {
+
+    user = {
         "user_id": payload["userId"],
         "email": payload.get("email"),
         "roles": payload.get("roles", []),
         "scopes": payload.get("scopes", []),
     }
 
+    # Cache for at most the TTL, never past the token's own expiry
+    ttl = _TOKEN_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        ttl = max(0.0, min(ttl, payload["exp"] - time.time()))
+    if ttl > 0:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[token] = (now + ttl, user)
+    return user
+
 
 def check_scopes(user_scopes: List[str], required_scopes: List[str]) -> bool:
     """
@@ -188,7 +259,7 @@ def check_scopes(user_scopes: List[str], required_scopes: List[str]) -> bool:
     Returns:
         True if user has all required scopes, False otherwise
     """
-    return all(scope in user_scopes for scope in required_scopes)
+    return set(user_scopes).issuperset(required_scopes)
 
 
 def require_scopes(user_scopes: List[str], required_scopes: List[str]) -> None:
@@ -202,8 +273,9 @@ def require_scopes(user_scopes: List[str], required_scopes: List[str]) -> None:
     Raises:
         AuthorizationError: If user doesn't have required scopes
     """
-    if not check_scopes(user_scopes, required_scopes):
-        missing_scopes = [s for s in required_scopes if s not in user_scopes]
+    user_scope_set = set(user_scopes)
+    missing_scopes = [s for s in required_scopes if s not in user_scope_set]
+    if missing_scopes:
         raise AuthorizationError(
             f"Insufficient permissions. Missing scopes: {', '.join(missing_scopes)}"
         )
@@ -14,6 +14,16 @@ class CodeExecutionClient:
 
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = base_url or settings.CODE_EXECUTOR_URL
+        # One client per process: keeps a keepalive connection pool to the
+        # executor instead of paying a TCP handshake per submission.
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool (called on app shutdown)."""
+        await self._client.aclose()
 
     async def execute_code(
         self,
@@ -49,13 +59,12 @@ class CodeExecutionClient:
         if function_signature:
             payload["function_signature"] = function_signature
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/execution/execute",
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            f"{self.base_url}/api/v1/execution/execute",
+            json=payload,
+        )
+        response.raise_for_status()
+        return response.json()
 
 
 # Singleton instance
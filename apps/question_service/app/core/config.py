@@ -11,6 +11,8 @@
 #   - Added validation for required environment variables
 #   - Enhanced security settings for production
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -27,6 +29,13 @@ class Settings(BaseSettings):
     # Code Execution Service settings
     CODE_EXECUTOR_URL: str = "http://code-execution-service:3010"  # URL to Code Execution Service
 
+    # Database connection pool settings
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 20  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1500  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = False  # see app/core/database.py for the tradeoff
+
     # ✅ Only use model_config (remove the inner Config class)
     model_config = {
         "env_file": ".env",
@@ -34,4 +43,10 @@ class Settings(BaseSettings):
         "extra": "allow",  # optional: allows extra env vars
     }
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; .env is read and validated a single time."""
+    return Settings()
+
+
+settings = get_settings()
@@ -50,7 +50,7 @@ async def get_current_user(request: Request) -> dict:
     if not token:
         raise AuthenticationError("No authentication token provided")
     
-    user = get_current_user_from_token(token)
+    user = await get_current_user_from_token(token)
     return user
 
 
@@ -77,7 +77,7 @@ async def get_current_user_optional(request: Request) -> Optional[dict]:
         return None
     
     try:
-        user = get_current_user_from_token(token)
+        user = await get_current_user_from_token(token)
         return user
     except AuthenticationError:
         return None
@@ -14,20 +14,52 @@
 #   - Added logging configuration
 #   - Integrated observability (metrics, health checks)
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 
 from app.api.router import api_router
+from app.core.code_execution_client import code_execution_client
+
 
-app = FastAPI(title="Question Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled connections to the code execution service
+    await code_execution_client.aclose()
+
+
+# orjson serializes the nested question payloads several times faster than
+# the stdlib json encoder behind the default JSONResponse
+app = FastAPI(
+    title="Question Service",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS - get allowed origins from environment variable
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
-allowed_origins = [origin.strip() for origin in cors_origins.split(",")]
+allowed_origins = frozenset(
+    origin.strip() for origin in cors_origins.split(",") if origin.strip()
+)
+
+
+class SetMembershipCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks origins by set membership, not a list scan"""
+
+    def __init__(self, app, allow_origins=(), **kwargs):
+        super().__init__(app, allow_origins=list(allow_origins), **kwargs)
+        self._allowed_set = frozenset(allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        return origin in self._allowed_set or super().is_allowed_origin(origin)
+
 
 app.add_middleware(
-    CORSMiddleware,
+    SetMembershipCORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
@@ -36,7 +68,11 @@ app.add_middleware(
 
 app.include_router(api_router)
 
-# Basic health endpoint for k8s probes
+# Basic health endpoint for k8s probes; the body is static, so serialize it
+# once at import instead of on every probe
+_HEALTH_RESPONSE = Response(content=b'{"status":"ok"}', media_type="application/json")
+
+
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return _HEALTH_RESPONSE
@@ -66,8 +66,10 @@ async def metrics_middleware(request: Request, call_next: Callable) -> Response:
         response = await call_next(request)
         duration = time.time() - start_time
         
-        # Normalize endpoint path (remove IDs for better aggregation)
-        endpoint = request.url.path
+        # Label with the matched route template (e.g. /questions/{question_id})
+        # so path parameters don't create one label series per ID
+        route = request.scope.get("route")
+        endpoint = route.path if route is not None else request.url.path
         
         REQUEST_COUNT.labels(
             method=request.method,
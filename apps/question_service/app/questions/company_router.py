@@ -28,15 +28,17 @@ def list_companies(
     db: Session = Depends(get_db)
 ):
     """List all companies"""
-    companies = crud.get_companies(db, skip=skip, limit=limit)
+    # Counts come from the aggregate query; len(c.questions) would lazy-load
+    # every company's question collection (N+1)
+    companies = crud.get_companies_with_counts(db, skip=skip, limit=limit)
     return [
         schemas.CompanyResponse(
             id=c.id,
             name=c.name,
             description=c.description,
-            question_count=len(c.questions)
+            question_count=question_count
         )
-        for c in companies
+        for c, question_count in companies
     ]
 
 
@@ -54,7 +56,7 @@ def get_company(
         id=company.id,
         name=company.name,
         description=company.description,
-        question_count=len(company.questions)
+        question_count=crud.get_company_question_count(db, company_id)
     )
 
 
@@ -70,7 +72,7 @@ def create_company(
             id=db_company.id,
             name=db_company.name,
             description=db_company.description,
-            question_count=len(db_company.questions)
+            question_count=0  # a new company has no questions yet
         )
     except IntegrityError:
         raise HTTPException(
@@ -94,7 +96,7 @@ def update_company(
         id=db_company.id,
         name=db_company.name,
         description=db_company.description,
-        question_count=len(db_company.questions)
+        question_count=crud.get_company_question_count(db, company_id)
     )
 
 
@@ -14,16 +14,25 @@
 #   - Enhanced filtering logic for topic/difficulty combinations
 #   - Added comprehensive error handling
 
-import hashlib
 import random
+import time
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, delete, desc, exists, func, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, undefer
 
 from . import models, schemas
 
+# Schema enum -> model enum maps, built once so the per-request conversions
+# are a dict lookup instead of a .value/.upper()/getitem chain
+_DIFF_MAP = {d: models.DifficultyEnum[d.value.upper()] for d in schemas.DifficultyEnum}
+_VIS_MAP = {
+    v: models.TestCaseVisibilityEnum[v.value.upper()] for v in schemas.TestCaseVisibility
+}
+
 # ============================================================================
 # QUESTION CRUD
 # ============================================================================
@@ -49,7 +58,7 @@ def create_question(db: Session, question: schemas.QuestionCreate):
     db_question = models.Question(
         title=question.title,
         description=question.description,
-        difficulty=models.DifficultyEnum[question.difficulty.value.upper()],
+        difficulty=_DIFF_MAP[question.difficulty],
         code_templates=question.code_templates,
         function_signature=question.function_signature,
         constraints=question.constraints,
@@ -66,23 +75,23 @@ def create_question(db: Session, question: schemas.QuestionCreate):
     
     db.add(db_question)
     db.commit()
-    db.refresh(db_question)
-    
-    # Add test cases
+
+    # Add test cases in one bulk INSERT instead of a round-trip per case
     if question.test_cases:
-        for tc in question.test_cases:
-            test_case = models.TestCase(
-                question_id=db_question.id,
-                input_data=tc.input_data,
-                expected_output=tc.expected_output,
-                visibility=models.TestCaseVisibilityEnum[tc.visibility.value.upper()],
-                order_index=tc.order_index,
-                explanation=tc.explanation,
-            )
-            db.add(test_case)
+        rows = [
+            {
+                "question_id": db_question.id,
+                "input_data": tc.input_data,
+                "expected_output": tc.expected_output,
+                "visibility": _VIS_MAP[tc.visibility],
+                "order_index": tc.order_index,
+                "explanation": tc.explanation,
+            }
+            for tc in question.test_cases
+        ]
+        db.execute(models.TestCase.__table__.insert(), rows)
         db.commit()
-        db.refresh(db_question)
-    
+
     return db_question
 
 
@@ -92,9 +101,14 @@ def get_questions(
     user_id: Optional[str] = None
 ):
     """Get questions with filters and pagination"""
+    # selectinload: joinedload on many-to-many multiplies rows by tag count
+    # and forces client-side dedup; one IN-query per collection is cheaper.
+    # raiseload turns any other relationship access into an error instead of
+    # a silent per-row query, so N+1s can't creep back in.
     query = db.query(models.Question).options(
-        joinedload(models.Question.topics),
-        joinedload(models.Question.companies)
+        selectinload(models.Question.topics),
+        selectinload(models.Question.companies),
+        raiseload('*')
     )
     
     # Filter out soft-deleted questions by default (unless include_deleted is True)
@@ -103,46 +117,59 @@ def get_questions(
     
     # Apply difficulty filter
     if filters.difficulties:
-        difficulty_enums = [models.DifficultyEnum[d.value.upper()] for d in filters.difficulties]
+        difficulty_enums = [_DIFF_MAP[d] for d in filters.difficulties]
         query = query.filter(models.Question.difficulty.in_(difficulty_enums))
     
-    # Apply topic filter
+    # Apply topic filter (EXISTS subquery: no join, so no duplicated rows)
     if filters.topic_ids:
-        query = query.join(models.Question.topics).filter(models.Topic.id.in_(filters.topic_ids))
-    
+        query = query.filter(
+            models.Question.topics.any(models.Topic.id.in_(filters.topic_ids))
+        )
+
     # Apply company filter
     if filters.company_ids:
-        query = query.join(models.Question.companies).filter(models.Company.id.in_(filters.company_ids))
+        query = query.filter(
+            models.Question.companies.any(models.Company.id.in_(filters.company_ids))
+        )
     
     # Apply search filter
     if filters.search:
         query = query.filter(models.Question.title.ilike(f"%{filters.search}%"))
     
-    # Apply user-specific filters
+    # Apply user-specific filters as EXISTS subqueries, like the topic and
+    # company filters: an outer join would emit one row per language attempt,
+    # so a question solved in two languages counted twice
     if user_id:
         if filters.attempted_only or filters.solved_only or filters.unsolved_only:
-            query = query.outerjoin(
-                models.UserQuestionAttempt,
-                and_(
-                    models.UserQuestionAttempt.question_id == models.Question.id,
-                    models.UserQuestionAttempt.user_id == user_id
-                )
+            user_attempt = and_(
+                models.UserQuestionAttempt.question_id == models.Question.id,
+                models.UserQuestionAttempt.user_id == user_id
             )
-            
+
             if filters.solved_only:
-                query = query.filter(models.UserQuestionAttempt.is_solved == True)
+                query = query.filter(
+                    exists().where(and_(
+                        user_attempt,
+                        models.UserQuestionAttempt.is_solved == True
+                    ))
+                )
             elif filters.unsolved_only:
+                # Never attempted, or has an attempt that isn't solved
                 query = query.filter(
                     or_(
-                        models.UserQuestionAttempt.is_solved == False,
-                        models.UserQuestionAttempt.id == None
+                        exists().where(and_(
+                            user_attempt,
+                            models.UserQuestionAttempt.is_solved == False
+                        )),
+                        ~exists().where(user_attempt)
                     )
                 )
             elif filters.attempted_only:
-                query = query.filter(models.UserQuestionAttempt.id != None)
-    
-    # Get total count before pagination
-    total = query.with_entities(models.Question.id).distinct().count()
+                query = query.filter(exists().where(user_attempt))
+
+    # Get total count before pagination. The EXISTS filters never duplicate
+    # rows, so a plain COUNT suffices — no DISTINCT sort-unique pass.
+    total = query.with_entities(func.count(models.Question.id)).scalar()
     
     # Apply sorting
     if filters.random:
@@ -174,9 +201,10 @@ def get_questions(
 def get_question(db: Session, question_id: int, include_deleted: bool = False):
     """Get a single question by ID with all relationships"""
     query = db.query(models.Question).options(
-        joinedload(models.Question.topics),
-        joinedload(models.Question.companies),
-        joinedload(models.Question.test_cases)
+        selectinload(models.Question.topics),
+        selectinload(models.Question.companies),
+        selectinload(models.Question.test_cases),
+        undefer('*')  # detail views need the deferred JSON columns
     ).filter(models.Question.id == question_id)
     
     # Filter out soft-deleted unless explicitly requested
@@ -188,20 +216,37 @@ def get_question(db: Session, question_id: int, include_deleted: bool = False):
 
 def update_question(db: Session, question_id: int, question_update: schemas.QuestionUpdate):
     """Update a question"""
-    db_question = get_question(db, question_id)
-    if not db_question:
-        return None
-    
     # Update basic fields
     update_data = question_update.dict(exclude_unset=True, exclude={"topic_ids", "company_ids"})
-    
+
     # Convert difficulty enum if present
     if "difficulty" in update_data and update_data["difficulty"]:
-        update_data["difficulty"] = models.DifficultyEnum[update_data["difficulty"].value.upper()]
-    
+        update_data["difficulty"] = _DIFF_MAP[update_data["difficulty"]]
+
+    # Fast path for plain field edits: one UPDATE instead of loading the
+    # row (and its collections) just to setattr and flush it back
+    if question_update.topic_ids is None and question_update.company_ids is None:
+        result = db.execute(
+            update(models.Question)
+            .where(
+                models.Question.id == question_id,
+                models.Question.deleted_at.is_(None),
+            )
+            .values(updated_at=datetime.utcnow(), **update_data)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            return None
+        db.commit()
+        return get_question(db, question_id)
+
+    db_question = get_question(db, question_id)
+    if not db_question:
+        return None
+
     for field, value in update_data.items():
         setattr(db_question, field, value)
-    
+
     # Update topics if provided
     if question_update.topic_ids is not None:
         topics = db.query(models.Topic).filter(models.Topic.id.in_(question_update.topic_ids)).all()
@@ -214,25 +259,33 @@ def update_question(db: Session, question_id: int, question_update: schemas.Ques
     
     db_question.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(db_question)
     return db_question
 
 
 def delete_question(db: Session, question_id: int, permanent: bool = False):
     """Soft delete a question (or permanent delete if specified)"""
+    if not permanent:
+        # Soft delete is one UPDATE; the deleted_at IS NULL guard keeps the
+        # already-deleted case returning False without a prior SELECT
+        result = db.execute(
+            update(models.Question)
+            .where(
+                models.Question.id == question_id,
+                models.Question.deleted_at.is_(None),
+            )
+            .values(deleted_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount > 0
+
+    # Permanent delete goes through the ORM so the test_cases cascade and
+    # the association rows are cleaned up
     db_question = get_question(db, question_id, include_deleted=True)
     if not db_question:
         return False
-    
-    if permanent:
-        # Permanent delete - actually remove from database
-        db.delete(db_question)
-    else:
-        # Soft delete - set deleted_at timestamp
-        if db_question.deleted_at is not None:
-            return False  # Already deleted
-        db_question.deleted_at = datetime.utcnow()
-    
+
+    db.delete(db_question)
     db.commit()
     return True
 
@@ -252,16 +305,52 @@ def restore_question(db: Session, question_id: int):
     return db_question
 
 
+def _has_question_filters(filters: schemas.QuestionFilterParams) -> bool:
+    """True if any criteria narrows the question set beyond soft deletion"""
+    return bool(
+        filters.difficulties
+        or filters.topic_ids
+        or filters.company_ids
+        or filters.search
+        or filters.attempted_only
+        or filters.solved_only
+        or filters.unsolved_only
+        or filters.include_deleted
+    )
+
+
 def get_random_question(db: Session, filters: Optional[schemas.QuestionFilterParams] = None):
     """Get a random question with optional filters"""
-    if filters is None:
-        filters = schemas.QuestionFilterParams(random=True, page=1, page_size=1)
-    else:
-        filters.random = True
-        filters.page_size = 1
-    
+    if filters is None or not _has_question_filters(filters):
+        # Unfiltered fast path: jump to a random offset over the active-row
+        # count instead of ORDER BY random(), which sorts the whole table.
+        total = db.query(func.count(models.Question.id)).filter(
+            models.Question.deleted_at.is_(None)
+        ).scalar()
+        if not total:
+            return None
+        return db.query(models.Question).options(
+            selectinload(models.Question.topics),
+            selectinload(models.Question.companies),
+            undefer('*')  # served as a question detail
+        ).filter(
+            models.Question.deleted_at.is_(None)
+        ).offset(random.randrange(total)).first()
+
+    # Filtered path: ORDER BY random() LIMIT 1 over the narrowed set. The
+    # list query raiseloads everything but topics/companies, so re-fetch the
+    # pick through get_question for the full detail load (test cases, JSON
+    # columns).
+    filters.random = True
+    filters.page_size = 1
+
     questions, _ = get_questions(db, filters)
-    return questions[0] if questions else None
+    return get_question(db, questions[0].id) if questions else None
+
+
+# Daily question id per ISO date; the pick is fixed for the UTC day, so each
+# worker resolves the COUNT+OFFSET once and serves the rest from the cache.
+_daily_question_cache: dict = {}
 
 
 def get_daily_question(db: Session):
@@ -269,21 +358,39 @@ def get_daily_question(db: Session):
     # Use date as seed for deterministic daily question
     today = datetime.utcnow().date()
     date_string = today.isoformat()
-    seed = int(hashlib.md5(date_string.encode()).hexdigest(), 16)
-    
+
+    question_query = db.query(models.Question).options(
+        selectinload(models.Question.topics),
+        selectinload(models.Question.companies),
+        undefer('*')  # served as a question detail
+    ).filter(models.Question.deleted_at.is_(None))
+
+    cached_id = _daily_question_cache.get(date_string)
+    if cached_id is not None:
+        question = question_query.filter(models.Question.id == cached_id).first()
+        if question:
+            return question
+        # The cached pick was deleted since; fall through and re-resolve
+        _daily_question_cache.pop(date_string, None)
+
+    # Days since AD 1: deterministic, unique per day, and no MD5 context
+    # spun up per call just to map a date to an integer
+    seed = today.toordinal()
+
     # Get total question count (excluding deleted)
     total_questions = db.query(func.count(models.Question.id)).filter(
         models.Question.deleted_at.is_(None)
     ).scalar()
     if total_questions == 0:
         return None
-    
+
     # Select question based on seed
     question_index = seed % total_questions
-    return db.query(models.Question).options(
-        joinedload(models.Question.topics),
-        joinedload(models.Question.companies)
-    ).filter(models.Question.deleted_at.is_(None)).offset(question_index).first()
+    question = question_query.offset(question_index).first()
+    if question:
+        _daily_question_cache.clear()  # drop previous days
+        _daily_question_cache[date_string] = question.id
+    return question
 
 
 def get_similar_questions(db: Session, question_id: int, limit: int = 5):
@@ -295,8 +402,9 @@ def get_similar_questions(db: Session, question_id: int, limit: int = 5):
     topic_ids = [t.id for t in question.topics]
     
     query = db.query(models.Question).options(
-        joinedload(models.Question.topics),
-        joinedload(models.Question.companies)
+        selectinload(models.Question.topics),
+        selectinload(models.Question.companies),
+        raiseload('*')
     ).filter(
         models.Question.id != question_id,
         models.Question.difficulty == question.difficulty,
@@ -337,7 +445,7 @@ def create_test_case(db: Session, question_id: int, test_case: schemas.TestCaseC
         question_id=question_id,
         input_data=test_case.input_data,
         expected_output=test_case.expected_output,
-        visibility=models.TestCaseVisibilityEnum[test_case.visibility.value.upper()],
+        visibility=_VIS_MAP[test_case.visibility],
         order_index=test_case.order_index,
         explanation=test_case.explanation,
     )
@@ -360,7 +468,7 @@ def update_test_case(db: Session, test_case_id: int, test_case: schemas.TestCase
     
     db_test_case.input_data = test_case.input_data
     db_test_case.expected_output = test_case.expected_output
-    db_test_case.visibility = models.TestCaseVisibilityEnum[test_case.visibility.value.upper()]
+    db_test_case.visibility = _VIS_MAP[test_case.visibility]
     db_test_case.order_index = test_case.order_index
     db_test_case.explanation = test_case.explanation
     
@@ -371,12 +479,14 @@ def update_test_case(db: Session, test_case_id: int, test_case: schemas.TestCase
 
 def delete_test_case(db: Session, test_case_id: int):
     """Delete a test case"""
-    db_test_case = get_test_case(db, test_case_id)
-    if db_test_case:
-        db.delete(db_test_case)
-        db.commit()
-        return True
-    return False
+    # Delete by id in one roundtrip; rowcount tells us whether it existed
+    result = db.execute(
+        delete(models.TestCase)
+        .where(models.TestCase.id == test_case_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
 
 
 # ============================================================================
@@ -417,12 +527,19 @@ def update_topic(db: Session, topic_id: int, topic: schemas.TopicCreate):
 
 def delete_topic(db: Session, topic_id: int):
     """Delete a topic"""
-    db_topic = get_topic(db, topic_id)
-    if db_topic:
-        db.delete(db_topic)
-        db.commit()
-        return True
-    return False
+    # Clear the association rows explicitly (the FKs have no ON DELETE
+    # CASCADE), then delete by id — no load of the topic or its questions
+    db.execute(
+        delete(models.question_topics)
+        .where(models.question_topics.c.topic_id == topic_id)
+    )
+    result = db.execute(
+        delete(models.Topic)
+        .where(models.Topic.id == topic_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
 
 
 # ============================================================================
@@ -434,6 +551,28 @@ def get_companies(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.Company).offset(skip).limit(limit).all()
 
 
+def get_companies_with_counts(db: Session, skip: int = 0, limit: int = 100):
+    """Get all companies with their question counts in one aggregate query"""
+    return (
+        db.query(models.Company, func.count(models.Question.id))
+        .outerjoin(models.Company.questions)
+        .group_by(models.Company.id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_company_question_count(db: Session, company_id: int) -> int:
+    """Count a company's questions without loading the collection"""
+    return (
+        db.query(func.count(models.Question.id))
+        .join(models.Question.companies)
+        .filter(models.Company.id == company_id)
+        .scalar()
+    )
+
+
 def get_company(db: Session, company_id: int):
     """Get a single company"""
     return db.query(models.Company).filter(models.Company.id == company_id).first()
@@ -467,12 +606,17 @@ def update_company(db: Session, company_id: int, company: schemas.CompanyCreate)
 
 def delete_company(db: Session, company_id: int):
     """Delete a company"""
-    db_company = get_company(db, company_id)
-    if db_company:
-        db.delete(db_company)
-        db.commit()
-        return True
-    return False
+    db.execute(
+        delete(models.question_companies)
+        .where(models.question_companies.c.company_id == company_id)
+    )
+    result = db.execute(
+        delete(models.Company)
+        .where(models.Company.id == company_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
 
 
 # ============================================================================
@@ -488,8 +632,12 @@ def get_user_attempts(db: Session, user_id: str, skip: int = 0, limit: int = 50)
 
 def get_user_solved_questions(db: Session, user_id: str):
     """Get user's solved questions"""
+    # selectinload keeps the wide Question row out of the attempt join, and
+    # load_only narrows it to the two columns the response actually uses
     attempts = db.query(models.UserQuestionAttempt).options(
-        joinedload(models.UserQuestionAttempt.question)
+        selectinload(models.UserQuestionAttempt.question).load_only(
+            models.Question.title, models.Question.difficulty
+        )
     ).filter(
         models.UserQuestionAttempt.user_id == user_id,
         models.UserQuestionAttempt.is_solved == True
@@ -501,19 +649,33 @@ def get_user_solved_questions(db: Session, user_id: str):
 
 def get_user_stats(db: Session, user_id: str) -> schemas.UserStats:
     """Get user statistics"""
-    attempts = db.query(models.UserQuestionAttempt).options(
-        joinedload(models.UserQuestionAttempt.question)
-    ).filter(models.UserQuestionAttempt.user_id == user_id).all()
-    
-    total_attempted = len(attempts)
-    total_solved = sum(1 for a in attempts if a.is_solved)
-    
-    # Count by difficulty
-    easy_solved = sum(1 for a in attempts if a.is_solved and a.question.difficulty == models.DifficultyEnum.EASY)
-    medium_solved = sum(1 for a in attempts if a.is_solved and a.question.difficulty == models.DifficultyEnum.MEDIUM)
-    hard_solved = sum(1 for a in attempts if a.is_solved and a.question.difficulty == models.DifficultyEnum.HARD)
-    
-    total_submissions = sum(a.attempts_count for a in attempts)
+    # One grouped aggregate (at most three rows back) instead of loading
+    # every attempt with its joined question and counting in Python
+    rows = db.query(
+        models.Question.difficulty,
+        func.count(models.UserQuestionAttempt.id),
+        func.sum(case((models.UserQuestionAttempt.is_solved == True, 1), else_=0)),
+        func.sum(models.UserQuestionAttempt.attempts_count),
+    ).join(
+        models.Question,
+        models.UserQuestionAttempt.question_id == models.Question.id
+    ).filter(
+        models.UserQuestionAttempt.user_id == user_id
+    ).group_by(models.Question.difficulty).all()
+
+    total_attempted = 0
+    total_solved = 0
+    total_submissions = 0
+    solved_by_difficulty = dict.fromkeys(models.DifficultyEnum, 0)
+    for difficulty, attempted, solved, submissions in rows:
+        total_attempted += attempted
+        total_solved += solved or 0
+        total_submissions += submissions or 0
+        solved_by_difficulty[difficulty] = solved or 0
+
+    easy_solved = solved_by_difficulty[models.DifficultyEnum.EASY]
+    medium_solved = solved_by_difficulty[models.DifficultyEnum.MEDIUM]
+    hard_solved = solved_by_difficulty[models.DifficultyEnum.HARD]
     acceptance_rate = (total_solved / total_submissions * 100) if total_submissions > 0 else 0
     
     return schemas.UserStats(
@@ -531,27 +693,40 @@ def get_user_stats(db: Session, user_id: str) -> schemas.UserStats:
 
 def create_user_attempt(db: Session, user_id: str, attempt: schemas.UserAttemptCreate):
     """Record a user attempt"""
+    # On Postgres, one atomic INSERT ... ON CONFLICT round trip against the
+    # unique (user_id, question_id, language) index replaces the
+    # select-then-update-or-insert dance
+    # A new attempt changes the aggregates, so drop the cached stats entry
+    _question_stats_cache.pop(attempt.question_id, None)
+
+    if db.get_bind().dialect.name == "postgresql":
+        return _upsert_user_attempt(db, user_id, attempt)
+
+    # One timestamp per invocation; last_attempted_at and first_solved_at
+    # should agree on a first solve anyway
+    now = datetime.utcnow()
+
     # Check if attempt record exists for this user, question, AND language
     db_attempt = db.query(models.UserQuestionAttempt).filter(
         models.UserQuestionAttempt.user_id == user_id,
         models.UserQuestionAttempt.question_id == attempt.question_id,
         models.UserQuestionAttempt.language == attempt.language
     ).first()
-    
+
     if db_attempt:
         # Update existing attempt
         db_attempt.attempts_count += 1
-        db_attempt.last_attempted_at = datetime.utcnow()
-        
+        db_attempt.last_attempted_at = now
+
         # Update status
         if attempt.is_solved:
             db_attempt.status = "solved"
         elif db_attempt.status == "not_attempted":
             db_attempt.status = "attempted"
-        
+
         if attempt.is_solved and not db_attempt.is_solved:
             db_attempt.is_solved = True
-            db_attempt.first_solved_at = datetime.utcnow()
+            db_attempt.first_solved_at = now
         
         # Update best runtime/memory
         if attempt.runtime_ms is not None:
@@ -571,18 +746,74 @@ def create_user_attempt(db: Session, user_id: str, attempt: schemas.UserAttemptC
             is_solved=attempt.is_solved,
             attempts_count=1,
             status=status,
-            last_attempted_at=datetime.utcnow(),
-            first_solved_at=datetime.utcnow() if attempt.is_solved else None,
+            last_attempted_at=now,
+            first_solved_at=now if attempt.is_solved else None,
             best_runtime_ms=attempt.runtime_ms,
             best_memory_mb=attempt.memory_mb
         )
         db.add(db_attempt)
-    
+
+    db.commit()
+    return db_attempt
+
+
+def _upsert_user_attempt(db: Session, user_id: str, attempt: schemas.UserAttemptCreate):
+    """Postgres upsert for create_user_attempt: one statement, RETURNING the row"""
+    now = datetime.utcnow()
+    table = models.UserQuestionAttempt.__table__
+    stmt = pg_insert(models.UserQuestionAttempt).values(
+        user_id=user_id,
+        question_id=attempt.question_id,
+        language=attempt.language,
+        is_solved=attempt.is_solved,
+        attempts_count=1,
+        status="solved" if attempt.is_solved else "attempted",
+        last_attempted_at=now,
+        first_solved_at=now if attempt.is_solved else None,
+        best_runtime_ms=attempt.runtime_ms,
+        best_memory_mb=attempt.memory_mb,
+    )
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "question_id", "language"],
+        set_={
+            "attempts_count": table.c.attempts_count + 1,
+            "last_attempted_at": excluded.last_attempted_at,
+            "is_solved": or_(table.c.is_solved, excluded.is_solved),
+            # "solved" sticks; otherwise promote not_attempted to attempted
+            "status": case(
+                (excluded.is_solved, "solved"),
+                (table.c.status == "not_attempted", "attempted"),
+                else_=table.c.status,
+            ),
+            # Keep the original solve time; set it only on the first solve
+            "first_solved_at": func.coalesce(
+                table.c.first_solved_at, excluded.first_solved_at
+            ),
+            # Postgres LEAST ignores NULLs, matching the is-None checks of
+            # the ORM path
+            "best_runtime_ms": func.least(
+                table.c.best_runtime_ms, excluded.best_runtime_ms
+            ),
+            "best_memory_mb": func.least(
+                table.c.best_memory_mb, excluded.best_memory_mb
+            ),
+        },
+    ).returning(models.UserQuestionAttempt)
+
+    db_attempt = db.execute(stmt).scalar_one()
     db.commit()
-    db.refresh(db_attempt)
     return db_attempt
 
 
+# Sorted runtime/memory arrays per (question_id, language); percentiles
+# tolerate a little staleness, so hot questions refresh at most once per TTL
+# and each submission in between costs two binary searches, not a query
+_PERCENTILE_TTL_SECONDS = 60.0
+_PERCENTILE_CACHE_MAX = 1024
+_percentile_cache: dict = {}  # (question_id, language) -> (expiry, runtimes, memories)
+
+
 def calculate_percentiles(
     db: Session,
     question_id: int,
@@ -596,31 +827,40 @@ def calculate_percentiles(
     indicates what % of submissions this beats (0-100).
     Only calculates if there are at least 10 successful submissions in the same language.
     """
-    # Query all successful attempts for this question in the same language
-    successful_attempts = db.query(
-        models.UserQuestionAttempt.best_runtime_ms,
-        models.UserQuestionAttempt.best_memory_mb
-    ).filter(
-        models.UserQuestionAttempt.question_id == question_id,
-        models.UserQuestionAttempt.language == language,
-        models.UserQuestionAttempt.is_solved == True,
-        models.UserQuestionAttempt.best_runtime_ms.isnot(None),
-        models.UserQuestionAttempt.best_memory_mb.isnot(None)
-    ).all()
-    
+    key = (question_id, language)
+    cached = _percentile_cache.get(key)
+    if cached is None or time.monotonic() >= cached[0]:
+        rows = db.query(
+            models.UserQuestionAttempt.best_runtime_ms,
+            models.UserQuestionAttempt.best_memory_mb,
+        ).filter(
+            models.UserQuestionAttempt.question_id == question_id,
+            models.UserQuestionAttempt.language == language,
+            models.UserQuestionAttempt.is_solved == True,
+            models.UserQuestionAttempt.best_runtime_ms.isnot(None),
+            models.UserQuestionAttempt.best_memory_mb.isnot(None)
+        ).all()
+        if len(_percentile_cache) >= _PERCENTILE_CACHE_MAX:
+            _percentile_cache.clear()
+        cached = (
+            time.monotonic() + _PERCENTILE_TTL_SECONDS,
+            sorted(runtime for runtime, _ in rows),
+            sorted(memory for _, memory in rows),
+        )
+        _percentile_cache[key] = cached
+
+    _, runtimes, memories = cached
+    total = len(runtimes)
+
     # Need minimum threshold for meaningful percentiles
-    if len(successful_attempts) < 10:
+    if total < 10:
         return None, None
-    
-    # Extract values
-    runtimes = [a.best_runtime_ms for a in successful_attempts]
-    memories = [a.best_memory_mb for a in successful_attempts]
-    
-    # Calculate percentiles (what % of submissions this beats)
-    # Lower runtime/memory is better, so we count how many are >= (worse than) current
-    runtime_percentile = (sum(1 for r in runtimes if r >= runtime_ms) / len(runtimes)) * 100
-    memory_percentile = (sum(1 for m in memories if m >= memory_mb) / len(memories)) * 100
-    
+
+    # Lower runtime/memory is better: everything at or above the submission
+    # is beaten, which is the slice from bisect_left to the end
+    runtime_percentile = (total - bisect_left(runtimes, runtime_ms)) / total * 100
+    memory_percentile = (total - bisect_left(memories, memory_mb)) / total * 100
+
     return round(runtime_percentile, 1), round(memory_percentile, 1)
 
 
@@ -628,25 +868,32 @@ def calculate_percentiles(
 # ANALYTICS CRUD
 # ============================================================================
 
+# Question stats are read-heavy and stable over seconds; cache them per
+# question with a short TTL, invalidated when a new attempt lands
+_QUESTION_STATS_TTL_SECONDS = 60.0
+_question_stats_cache: dict = {}  # question_id -> (monotonic expiry, stats)
+
+
 def get_question_stats(db: Session, question_id: int) -> Optional[schemas.QuestionStats]:
     """Get question statistics"""
+    cached = _question_stats_cache.get(question_id)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
     question = get_question(db, question_id)
     if not question:
         return None
-    
-    # Get all user attempts for this question
-    attempts = db.query(models.UserQuestionAttempt).filter(
+
+    # Average in SQL: AVG skips NULLs and returns NULL on no rows, matching
+    # the old Python filtering, with one row back instead of every attempt
+    avg_runtime, avg_memory = db.query(
+        func.avg(models.UserQuestionAttempt.best_runtime_ms),
+        func.avg(models.UserQuestionAttempt.best_memory_mb),
+    ).filter(
         models.UserQuestionAttempt.question_id == question_id
-    ).all()
+    ).one()
     
-    # Calculate averages
-    runtimes = [a.best_runtime_ms for a in attempts if a.best_runtime_ms is not None]
-    memories = [a.best_memory_mb for a in attempts if a.best_memory_mb is not None]
-    
-    avg_runtime = sum(runtimes) / len(runtimes) if runtimes else None
-    avg_memory = sum(memories) / len(memories) if memories else None
-    
-    return schemas.QuestionStats(
+    stats = schemas.QuestionStats(
         question_id=question_id,
         total_submissions=question.total_submissions,
         total_accepted=question.total_accepted,
@@ -657,6 +904,11 @@ def get_question_stats(db: Session, question_id: int) -> Optional[schemas.Questi
         average_memory_mb=avg_memory,
         difficulty_distribution={}  # TODO: Implement perceived difficulty tracking
     )
+    _question_stats_cache[question_id] = (
+        time.monotonic() + _QUESTION_STATS_TTL_SECONDS,
+        stats,
+    )
+    return stats
 
 
 def get_question_submissions(db: Session, question_id: int, limit: int = 20):
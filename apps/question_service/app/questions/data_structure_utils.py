@@ -3,7 +3,10 @@ Utility to generate commented data structure definitions for code editor.
 Similar to LeetCode's approach of showing commented class definitions above user code.
 """
 
-from typing import Any, Dict, List, Set
+import sys
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Dict, FrozenSet, List
 
 
 DATA_STRUCTURE_DEFINITIONS = {
@@ -94,30 +97,62 @@ DATA_STRUCTURE_DEFINITIONS = {
 }
 
 
-def detect_data_structures(function_signature: Dict[str, Any]) -> Set[str]:
+def _build_prebuilt_comments() -> Dict[str, Dict[frozenset, str]]:
+    """Precompute the combined comment block for every subset of structures.
+
+    The domain is tiny (subsets of {ListNode, TreeNode} per language), so the
+    sort + lookup + join work can all happen once at import and the hot path
+    becomes a single dict lookup.
+    """
+    names = sorted(DATA_STRUCTURE_DEFINITIONS)
+    languages = {
+        language
+        for definitions in DATA_STRUCTURE_DEFINITIONS.values()
+        for language in definitions
+    }
+    table: Dict[str, Dict[frozenset, str]] = {}
+    for language in languages:
+        # sys.intern: every render shares the same comment string objects
+        # instead of keeping per-response copies alive
+        table[language] = {
+            frozenset(subset): sys.intern("".join(
+                DATA_STRUCTURE_DEFINITIONS[name].get(language, "")
+                for name in subset
+            ))
+            for r in range(len(names) + 1)
+            for subset in combinations(names, r)
+        }
+    return table
+
+
+_PREBUILT_COMMENTS = _build_prebuilt_comments()
+
+
+@lru_cache(maxsize=4096)
+def _detect_from_types(arg_types: tuple, return_type: str) -> FrozenSet[str]:
+    """Cached core of detect_data_structures, keyed on the hashable types."""
+    data_structures = {t for t in arg_types if t in DATA_STRUCTURE_DEFINITIONS}
+    if return_type in DATA_STRUCTURE_DEFINITIONS:
+        data_structures.add(return_type)
+    return frozenset(data_structures)
+
+
+def detect_data_structures(function_signature: Dict[str, Any]) -> FrozenSet[str]:
     """
     Detect which custom data structures are used in the function signature.
-    
+
     Args:
         function_signature: Dictionary with function_name, arguments, and return_type
-        
+
     Returns:
         Set of data structure names (e.g., {"ListNode", "TreeNode"})
     """
-    data_structures = set()
-    
-    # Check arguments
-    for arg in function_signature.get("arguments", []):
-        arg_type = arg.get("type", "")
-        if arg_type in DATA_STRUCTURE_DEFINITIONS:
-            data_structures.add(arg_type)
-    
-    # Check return type
-    return_type = function_signature.get("return_type", "")
-    if return_type in DATA_STRUCTURE_DEFINITIONS:
-        data_structures.add(return_type)
-    
-    return data_structures
+    # Signatures are stored once per question but inspected on every
+    # template render, so reduce the dict to its hashable parts and memoize
+    arg_types = tuple(
+        arg.get("type", "") for arg in function_signature.get("arguments", [])
+    )
+    return _detect_from_types(arg_types, function_signature.get("return_type", ""))
 
 
 def generate_data_structure_comments(
@@ -136,19 +171,13 @@ def generate_data_structure_comments(
         Example: {"python": "# Definition for...\n", "javascript": "/**...\n"}
     """
     data_structures = detect_data_structures(function_signature)
-    
-    result = {}
-    for language in languages:
-        comments = []
-        for ds_name in sorted(data_structures):  # Sort for consistent ordering
-            if ds_name in DATA_STRUCTURE_DEFINITIONS:
-                definition = DATA_STRUCTURE_DEFINITIONS[ds_name].get(language, "")
-                if definition:
-                    comments.append(definition)
-        
-        result[language] = "".join(comments)
-    
-    return result
+
+    # The combined block per (language, subset) is precomputed at import;
+    # ordering is already consistent because the table is built sorted
+    return {
+        language: _PREBUILT_COMMENTS.get(language, {}).get(data_structures, "")
+        for language in languages
+    }
 
 
 def prepend_data_structure_comments(
@@ -165,15 +194,13 @@ def prepend_data_structure_comments(
     Returns:
         New dictionary with comments prepended to each template
     """
-    languages = list(code_templates.keys())
-    comments = generate_data_structure_comments(function_signature, languages)
-    
-    result = {}
-    for language, template in code_templates.items():
-        comment = comments.get(language, "")
-        if comment:
-            result[language] = comment + template
-        else:
-            result[language] = template
-    
-    return result
+    # Most questions use no custom structures; skip the comment table and
+    # the copy entirely (callers only read the returned mapping)
+    data_structures = detect_data_structures(function_signature)
+    if not data_structures:
+        return code_templates
+
+    return {
+        language: _PREBUILT_COMMENTS.get(language, {}).get(data_structures, "") + template
+        for language, template in code_templates.items()
+    }
@@ -30,8 +30,9 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -64,23 +65,25 @@ class Question(Base):
     description = Column(Text, nullable=False)
     difficulty = Column(Enum(DifficultyEnum), nullable=False, index=True)
     
+    # The JSON blobs below are deferred: list queries never read them, so
+    # they stay out of the SELECT unless a query opts in with undefer
     # Code template for different languages
     # Structure: {"python": "def solution():\n    pass", "javascript": "function solution() {}"}
-    code_templates = Column(JSON, nullable=False)
-    
+    code_templates = deferred(Column(JSON, nullable=False))
+
     # Function signature info for validation
     # Structure: {"function_name": "twoSum", "params": [...], "return_type": "..."}
-    function_signature = Column(JSON, nullable=False)
-    
+    function_signature = deferred(Column(JSON, nullable=False))
+
     # Constraints, hints, follow-up questions
     constraints = Column(Text)
-    hints = Column(JSON)  # Array of hint strings
-    
+    hints = deferred(Column(JSON))  # Array of hint strings
+
     # Execution limits - per language
     # Structure: {"python": 5, "javascript": 5, "java": 10, "cpp": 3}
-    time_limit = Column(JSON, nullable=False, default={"python": 5, "javascript": 5, "java": 10, "cpp": 3})
+    time_limit = deferred(Column(JSON, nullable=False, default={"python": 5, "javascript": 5, "java": 10, "cpp": 3}))
     # Structure: {"python": 64000, "javascript": 64000, "java": 128000, "cpp": 32000} (in KB)
-    memory_limit = Column(JSON, nullable=False, default={"python": 64000, "javascript": 64000, "java": 128000, "cpp": 32000})
+    memory_limit = deferred(Column(JSON, nullable=False, default={"python": 64000, "javascript": 64000, "java": 128000, "cpp": 32000}))
     
     # Metadata
     acceptance_rate = Column(Integer, default=0)
@@ -143,7 +146,15 @@ class TestCase(Base):
 # User-specific tracking (interfaces with User Service)
 class UserQuestionAttempt(Base):
     __tablename__ = 'user_question_attempts'
-    
+    __table_args__ = (
+        # One row per user/question/language; the Postgres upsert in
+        # crud.create_user_attempt targets this constraint
+        UniqueConstraint(
+            'user_id', 'question_id', 'language',
+            name='uq_user_attempts_user_question_language'
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     user_id = Column(String(255), nullable=False, index=True)  # From User Service
     question_id = Column(Integer, ForeignKey('questions.id'), nullable=False, index=True)
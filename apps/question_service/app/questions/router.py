@@ -16,7 +16,6 @@
 #   - Added user progress tracking
 #   - Implemented data structure helper generation
 
-import math
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -32,6 +31,38 @@ from app.questions.data_structure_utils import prepend_data_structure_comments
 
 router = APIRouter(prefix="/questions", tags=["Questions"])
 
+
+def _load_attempt_flags(db: Session, user_id: Optional[str], questions) -> dict:
+    """Fetch a user's attempt/solved flags for a batch of questions.
+
+    One IN query for the whole batch; a question maps to True if any
+    language attempt solved it, and its presence alone marks it attempted.
+    """
+    attempt_flags = {}
+    if user_id and questions:
+        rows = db.query(
+            models.UserQuestionAttempt.question_id,
+            models.UserQuestionAttempt.is_solved
+        ).filter(
+            models.UserQuestionAttempt.user_id == user_id,
+            models.UserQuestionAttempt.question_id.in_([q.id for q in questions])
+        ).all()
+        for qid, solved in rows:
+            attempt_flags[qid] = attempt_flags.get(qid, False) or solved
+    return attempt_flags
+
+
+def _csv_ints(value: Optional[str]) -> Optional[tuple]:
+    """Parse a comma-separated id list, returning None when absent"""
+    return None if not value else tuple(int(item) for item in value.split(","))
+
+
+def _csv_difficulties(value: Optional[str]) -> Optional[tuple]:
+    """Parse a comma-separated difficulty list, returning None when absent"""
+    return None if not value else tuple(
+        schemas.DifficultyEnum(item.strip()) for item in value.split(",")
+    )
+
 # ============================================================================
 # QUESTION CRUD
 # ============================================================================
@@ -58,24 +89,11 @@ def list_questions(
     # Extract user_id from authenticated user
     user_id = user["user_id"]
     
-    # Parse comma-separated values
-    difficulty_list = None
-    if difficulties:
-        difficulty_list = [schemas.DifficultyEnum(d.strip()) for d in difficulties.split(",")]
-    
-    topic_id_list = None
-    if topic_ids:
-        topic_id_list = [int(tid.strip()) for tid in topic_ids.split(",")]
-    
-    company_id_list = None
-    if company_ids:
-        company_id_list = [int(cid.strip()) for cid in company_ids.split(",")]
-    
     # Create filter params
     filters = schemas.QuestionFilterParams(
-        difficulties=difficulty_list,
-        topic_ids=topic_id_list,
-        company_ids=company_id_list,
+        difficulties=_csv_difficulties(difficulties),
+        topic_ids=_csv_ints(topic_ids),
+        company_ids=_csv_ints(company_ids),
         attempted_only=attempted_only,
         solved_only=solved_only,
         unsolved_only=unsolved_only,
@@ -88,22 +106,12 @@ def list_questions(
     )
     
     questions, total = crud.get_questions(db, filters, user_id)
-    
+
+    attempt_flags = _load_attempt_flags(db, user_id, questions)
+
     # Convert to list items
     question_items = []
     for q in questions:
-        # Get user attempt info if user_id provided
-        is_attempted = False
-        is_solved = False
-        if user_id:
-            attempt = db.query(models.UserQuestionAttempt).filter(
-                models.UserQuestionAttempt.user_id == user_id,
-                models.UserQuestionAttempt.question_id == q.id
-            ).first()
-            if attempt:
-                is_attempted = True
-                is_solved = attempt.is_solved
-        
         question_items.append(schemas.QuestionListItem(
             id=q.id,
             title=q.title,
@@ -111,12 +119,13 @@ def list_questions(
             acceptance_rate=q.acceptance_rate,
             topics=[schemas.TopicResponse(id=t.id, name=t.name, description=t.description) for t in q.topics],
             companies=[schemas.CompanyResponse(id=c.id, name=c.name) for c in q.companies],
-            is_attempted=is_attempted,
-            is_solved=is_solved,
+            is_attempted=q.id in attempt_flags,
+            is_solved=attempt_flags.get(q.id, False),
             deleted_at=q.deleted_at
         ))
     
-    total_pages = math.ceil(total / page_size)
+    # Ceiling division in integer math; no float round-trip
+    total_pages = (total + page_size - 1) // page_size
     
     return schemas.QuestionListResponse(
         questions=question_items,
@@ -141,22 +150,10 @@ def get_random_question(
     user_id = user["user_id"]
     
     # Parse filters similar to list_questions
-    difficulty_list = None
-    if difficulties:
-        difficulty_list = [schemas.DifficultyEnum(d.strip()) for d in difficulties.split(",")]
-    
-    topic_id_list = None
-    if topic_ids:
-        topic_id_list = [int(tid.strip()) for tid in topic_ids.split(",")]
-    
-    company_id_list = None
-    if company_ids:
-        company_id_list = [int(cid.strip()) for cid in company_ids.split(",")]
-    
     filters = schemas.QuestionFilterParams(
-        difficulties=difficulty_list,
-        topic_ids=topic_id_list,
-        company_ids=company_id_list,
+        difficulties=_csv_difficulties(difficulties),
+        topic_ids=_csv_ints(topic_ids),
+        company_ids=_csv_ints(company_ids),
         random=True,
         page=1,
         page_size=1
@@ -194,8 +191,9 @@ def get_question(
     user_id = user["user_id"]
     is_admin = "admin" in user.get("scopes", [])
     
-    # Check if user has attempted this question
-    user_has_attempted = db.query(models.UserQuestionAttempt).filter(
+    # Check if user has attempted this question; select only the id — the
+    # existence check doesn't need a hydrated ORM row
+    user_has_attempted = db.query(models.UserQuestionAttempt.id).filter(
         models.UserQuestionAttempt.user_id == user_id,
         models.UserQuestionAttempt.question_id == question_id
     ).first() is not None
@@ -278,20 +276,11 @@ def get_similar_questions(
     """Get similar questions based on topics and difficulty"""
     user_id = user["user_id"]
     similar = crud.get_similar_questions(db, question_id, limit)
-    
+
+    attempt_flags = _load_attempt_flags(db, user_id, similar)
+
     result = []
     for q in similar:
-        is_attempted = False
-        is_solved = False
-        if user_id:
-            attempt = db.query(models.UserQuestionAttempt).filter(
-                models.UserQuestionAttempt.user_id == user_id,
-                models.UserQuestionAttempt.question_id == q.id
-            ).first()
-            if attempt:
-                is_attempted = True
-                is_solved = attempt.is_solved
-        
         result.append(schemas.QuestionListItem(
             id=q.id,
             title=q.title,
@@ -299,8 +288,8 @@ def get_similar_questions(
             acceptance_rate=q.acceptance_rate,
             topics=[schemas.TopicResponse(id=t.id, name=t.name, description=t.description) for t in q.topics],
             companies=[schemas.CompanyResponse(id=c.id, name=c.name) for c in q.companies],
-            is_attempted=is_attempted,
-            is_solved=is_solved
+            is_attempted=q.id in attempt_flags,
+            is_solved=attempt_flags.get(q.id, False)
         ))
     
     return result
@@ -687,7 +676,12 @@ def _build_question_detail(db: Session, question: models.Question, user_id: Opti
     user_attempts_count = 0
     
     if user_id:
-        attempt = db.query(models.UserQuestionAttempt).filter(
+        # Project just the two columns the response needs instead of
+        # hydrating a full attempt object
+        attempt = db.query(
+            models.UserQuestionAttempt.is_solved,
+            models.UserQuestionAttempt.attempts_count
+        ).filter(
             models.UserQuestionAttempt.user_id == user_id,
             models.UserQuestionAttempt.question_id == question.id
         ).first()